@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Shared synthetic market data and Fibonacci helpers for the test scripts"""
+
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Every test script imports this module first, so the detector's directory is put on sys.path once
+# per session; it goes first so its config.py wins over the root bot's
+MONITORS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fibonacci_monitors')
+if MONITORS_DIR not in sys.path:
+    sys.path.insert(0, MONITORS_DIR)
+
+# Fibonacci ratios in the order FibonacciDetector.calculate_fibonacci_levels returns them
+FIB_RATIOS = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
+FIB_RATIOS.setflags(write=False)  # shared by every test, so no test can change another's ratios
+FIB_618 = 4  # position of the 0.618 ratio
+_FIB_KEYS = FIB_RATIOS.tolist()
+
+def fib_prices(fib_levels):
+    """Detector level dict as a price array aligned with FIB_RATIOS"""
+    return np.array([fib_levels[r] for r in _FIB_KEYS])
+
+# Per-level line prefixes ("  62%: $"), formatted once
+_FIB_LABELS = np.char.mod("  %.0f%%: $", FIB_RATIOS * 100)
+
+def print_fib_levels(prices):
+    """Print one line per Fibonacci level, in FIB_RATIOS order, formatting all prices in one call"""
+    print("\n".join(np.char.add(_FIB_LABELS, np.char.mod("%.2f", np.asarray(prices, dtype=float))).tolist()))
+
+@contextmanager
+def buffered_stdout():
+    """Collect a standalone run's print() output and write it to stdout in one call on exit"""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends each thread's writes to the buffer it registered, else to the real stream"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self):
+        """Route the calling thread's output to a fresh buffer and return it"""
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def write(self, s):
+        return getattr(self._local, 'buf', self._stream).write(s)
+
+    def flush(self):
+        getattr(self._local, 'buf', self._stream).flush()
+
+def run_concurrently(tests):
+    """Run (name, func) tests on a thread pool; returns (name, result or raised exception, printed output) in order"""
+    proxy = _PerThreadStdout(sys.stdout)
+
+    def run(test):
+        name, func = test
+        buf = proxy.capture()
+        try:
+            result = func()
+        except Exception as e:
+            result = e
+        return name, result, buf.getvalue()
+
+    with redirect_stdout(proxy), ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        return list(pool.map(run, tests))
+
+@lru_cache(maxsize=1)
+def get_detector():
+    """FibonacciDetector shared by every test, so matplotlib styling and the chart figure are set up once"""
+    from fibonacci_detector import FibonacciDetector
+    return FibonacciDetector()
+
+# lru_cache does not stop concurrent misses, so tests running in parallel take this around the live fetches
+_FETCH_LOCK = threading.Lock()
+
+@lru_cache(maxsize=8)
+def _fetch_binance_ohlcv(symbol, interval, limit):
+    return get_detector().get_binance_data(symbol, interval, limit)
+
+def binance_ohlcv(symbol, interval, limit):
+    """Live candles fetched once per (symbol, interval, limit); each caller gets its own shallow copy"""
+    with _FETCH_LOCK:
+        df = _fetch_binance_ohlcv(symbol, interval, limit)
+    return df.copy(deep=False)
+
+@lru_cache(maxsize=8)
+def _binance_swing_points(symbol, interval, limit, lookback):
+    df = _fetch_binance_ohlcv(symbol, interval, limit)
+    if df.empty:
+        return None, None
+    return get_detector().detect_swing_points(df, lookback)
+
+def binance_swings(symbol, interval, limit, lookback):
+    """(candles, swing_high_idx, swing_low_idx) for live data, with the fetch and swing scan each run once"""
+    with _FETCH_LOCK:
+        swings = _binance_swing_points(symbol, interval, limit, lookback)
+    return (binance_ohlcv(symbol, interval, limit),) + swings
+
+def flat_candles(n, price, volume=1000):
+    """Writable (n, 5) OHLCV slab of flat candles, copied from one broadcast row"""
+    return np.broadcast_to(np.array([price, price, price, price, volume], dtype=np.float64), (n, 5)).copy()
+
+def hlc_arrays(df):
+    """(high, low, close) columns as float64 arrays, extracted once for every check and detector call in a test"""
+    return tuple(df[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close'))
+
+def find_swings(df):
+    """Highest high / lowest low as (high_idx, low_idx, high_price, low_price, trend) from one fused pass"""
+    from fibonacci_detector import _detect_swing_points_nb
+    high, low, _ = hlc_arrays(df)
+    # Whole frame, no confirmation bars: same first-occurrence positions as argmax/argmin
+    hi_pos, lo_pos = _detect_swing_points_nb(high, low, len(high), 0)
+    assert hi_pos >= 0 and lo_pos >= 0, "no swing points found"
+    trend = "DOWN" if hi_pos < lo_pos else "UP"
+    return df.index[hi_pos], df.index[lo_pos], high[hi_pos], low[lo_pos], trend
+
+@lru_cache(maxsize=None)
+def date_index(start, n, freq):
+    """DatetimeIndex for synthetic candles; indexes are immutable, so one per (start, n, freq) is shared"""
+    return pd.date_range(start, periods=n, freq=freq)
+
+# One Generator per seed, with the state it was seeded to, shared by every fixture call
+_RNGS = {}
+
+def make_rng(seed=42):
+    """Shared Generator for `seed`, rewound to its freshly seeded state instead of being reseeded"""
+    if seed not in _RNGS:
+        rng = np.random.default_rng(seed)
+        _RNGS[seed] = (rng, rng.bit_generator.state)
+    rng, state = _RNGS[seed]
+    rng.bit_generator.state = state
+    return rng
+
+def make_ohlcv(n=100, seed=42, base_price=115000, drift=-2000, freq='15min', start='2025-01-01'):
+    """Build a trending OHLCV DataFrame from one RNG, filling a single 2D array in place"""
+    rng = make_rng(seed)
+    # Column-major so every OHLCV column is a contiguous row of data.T that the RNG can fill directly
+    data = np.empty((n, 5), order='F')
+    open_, high, low, close, volume = data.T
+
+    rng.standard_normal(out=open_)
+    open_ *= 100
+    open_ += np.linspace(base_price, base_price + drift, n)
+    rng.standard_normal(out=close)
+    close *= 20
+    close += open_
+
+    # Candle extremes must enclose open and close (the offsets are non-negative, so open is covered)
+    rng.random(out=high)
+    high *= 50
+    high += open_
+    np.maximum(high, close, out=high)
+    rng.random(out=low)
+    low *= -50
+    low += open_
+    np.minimum(low, close, out=low)
+
+    rng.random(out=volume)
+    volume *= 4000
+    volume += 1000
+
+    return pd.DataFrame(data, index=date_index(start, n, freq), columns=['open', 'high', 'low', 'close', 'volume'])
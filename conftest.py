@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+import _fixtures  # noqa: F401  puts fibonacci_monitors on sys.path before any test module is collected
+import config  # noqa: F401  bind the detector's config before pytest re-prepends the repo root per module
+
+# The test scripts print tables for humans; under pytest those are dropped unless TEST_VERBOSE is set
+TEST_VERBOSE = os.getenv("TEST_VERBOSE", "0") != "0"
+
+class _NullWriter:
+    """stdout replacement that discards writes without touching a buffer or file descriptor"""
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+@pytest.fixture(autouse=True)
+def no_savefig(monkeypatch):
+    """Skip PNG encoding under pytest; chart tests only check the plotting path and returned filename"""
+    monkeypatch.setattr("matplotlib.figure.Figure.savefig", lambda self, *args, **kwargs: None)
+
+@pytest.fixture(autouse=True)
+def quiet_prints(monkeypatch):
+    """Discard the scripts' print() output (standalone runs still print everything)"""
+    if not TEST_VERBOSE:
+        monkeypatch.setattr(sys, "stdout", _NullWriter())
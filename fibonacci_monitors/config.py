@@ -12,6 +12,10 @@ MIN_MOVE_PERCENT = 0.03  # 3% minimum move from swing low to high
 SWING_LOOKBACK = 50  # Number of candles to look back for swing detection
 CHECK_INTERVAL_MINUTES = 5  # How often to check for setups
 
+# Max candles of history used for swing detection and indicators, per timeframe
+MAX_LOOKBACK_BARS = {'1m': 500, '5m': 500, '15m': 500, '1h': 300, '4h': 300, '1d': 200}
+DEFAULT_MAX_LOOKBACK = 300
+
 # Detection Strictness/Profile
 # Profiles: STRICT, BALANCED, LENIENT
 DETECTION_PROFILE = os.getenv('DETECTION_PROFILE', 'BALANCED').upper()
@@ -3,11 +3,18 @@ import json
 from datetime import datetime
 from typing import Dict, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from config import DISCORD_WEBHOOK_URL, DISCORD_USERNAME, DISCORD_AVATAR_URL, USE_AI_FILTER
 from gemini_filter import GeminiSetupFilter
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on a webhook call before giving up
+WEBHOOK_TIMEOUT = 30
+
+# Chart follow-up uploads run here, off the detector's single chart-render worker
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='discord-upload')
+
 class DiscordNotifier:
     def __init__(self):
         self.webhook_url = DISCORD_WEBHOOK_URL
@@ -54,11 +61,17 @@ class DiscordNotifier:
             response = requests.post(
                 self.webhook_url,
                 data={'payload_json': json.dumps(payload)},
-                files=files
+                files=files,
+                timeout=WEBHOOK_TIMEOUT
             )
             
             if response.status_code == 204:
                 logger.info("Discord alert sent successfully")
+                # Chart still rendering in the background: post it as a follow-up once ready
+                chart_future = detection_result.get('chart_future')
+                if chart_future is not None:
+                    chart_future.add_done_callback(
+                        lambda f: _UPLOAD_EXECUTOR.submit(self._send_chart_followup, f, detection_result))
                 return True
             else:
                 logger.error(f"Failed to send Discord alert: {response.status_code} - {response.text}")
@@ -68,6 +81,38 @@ class DiscordNotifier:
             logger.error(f"Error sending Discord alert: {e}")
             return False
     
+    def _send_chart_followup(self, chart_future, detection_result: Dict) -> None:
+        """Send the background-rendered chart for an alert that was already posted"""
+        try:
+            chart_filename = chart_future.result()
+            if not chart_filename:
+                return
+            detection_result['chart_filename'] = chart_filename
+            
+            with open(chart_filename, 'rb') as f:
+                files = [('file', (chart_filename, f.read(), 'image/png'))]
+            
+            payload = {
+                'username': self.username,
+                'avatar_url': self.avatar_url,
+                'content': f"📈 Chart for {detection_result['symbol']} {detection_result['timeframe']}"
+            }
+            
+            response = requests.post(
+                self.webhook_url,
+                data={'payload_json': json.dumps(payload)},
+                files=files,
+                timeout=WEBHOOK_TIMEOUT
+            )
+            
+            if response.status_code == 204:
+                logger.info("Discord chart follow-up sent successfully")
+            else:
+                logger.error(f"Failed to send Discord chart follow-up: {response.status_code} - {response.text}")
+                
+        except Exception as e:
+            logger.error(f"Error sending Discord chart follow-up: {e}")
+    
     def _labels_from_fib(self, fib_levels: Dict[float, float], swing_high: float, swing_low: float) -> Dict[str, str]:
         """Determine correct labels for 0%/100% based on actual prices, not setup type."""
         zero_is_high = abs(fib_levels[0.0] - swing_high) <= abs(fib_levels[0.0] - swing_low)
@@ -249,7 +294,8 @@ If you received this message, the bot is properly configured and ready to send F
             
             response = requests.post(
                 self.webhook_url,
-                json=payload
+                json=payload,
+                timeout=WEBHOOK_TIMEOUT
             )
             
             if response.status_code == 204:
@@ -64,7 +64,8 @@ class EnhancedSingleMonitor:
                 timeframe=self.config.timeframe,
                 margin=self.config.margin,
                 min_move_percent=self.config.min_move_percent,
-                swing_lookback=self.config.swing_lookback
+                swing_lookback=self.config.swing_lookback,
+                defer_chart=True
             )
             
             if result is None:
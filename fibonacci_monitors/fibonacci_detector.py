@@ -1,14 +1,27 @@
 import numpy as np
 import pandas as pd
 import os
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
 import requests
 import json
 from typing import Tuple, Optional, Dict, List
 import logging
+import threading
 from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the decorated helpers run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 from config import (
     LENIENT_MODE,
     DETECTION_PROFILE,
@@ -20,6 +33,8 @@ from config import (
     WICK_MIN_RATIO_STD,
     WICK_MIN_RATIO_SLOW,
     VOLUME_MIN_MULTIPLIER,
+    MAX_LOOKBACK_BARS,
+    DEFAULT_MAX_LOOKBACK,
     # Advanced pivots
     USE_ZIGZAG_PIVOTS,
     ZIGZAG_DEPTH,
@@ -71,6 +86,136 @@ CHART_WIDTH = 16
 CHART_HEIGHT = 10
 DPI = 100
 
+# Retracement ratios in FIBONACCI_LEVELS order, as an array for vectorized level math
+_FIB_RATIOS = np.array(list(FIBONACCI_LEVELS))
+_FIB_RATIOS.setflags(write=False)  # shared by every detector and the level kernel
+_FIB_RATIO_KEYS = _FIB_RATIOS.tolist()
+# Position of each ratio in a calculate_fibonacci_level_array result
+FIB_INDEX = {ratio: i for i, ratio in enumerate(_FIB_RATIO_KEYS)}
+
+# Background chart rendering; a single worker because the cached Figure and pyplot are not thread-safe
+_CHART_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart')
+
+# One chart Figure and its (price, volume) axes shared by every detector, redrawn for each alert.
+# Renders also happen synchronously on monitor threads, so all access goes through _CHART_LOCK.
+_CHART_LOCK = threading.Lock()
+_chart_figure = None
+
+def _get_chart_axes():
+    """Return the shared chart figure and axes, cleared for a new render (caller holds _CHART_LOCK)"""
+    global _chart_figure
+    if _chart_figure is None:
+        fig = Figure(figsize=(CHART_WIDTH, CHART_HEIGHT), dpi=DPI)
+        axes = fig.subplots(2, 1, gridspec_kw={'height_ratios': [3, 1]})
+        # Fixed margins instead of tight_layout; the right side leaves room for the legend
+        fig.subplots_adjust(left=0.06, right=0.80, top=0.93, bottom=0.06, hspace=0.2)
+        _chart_figure = (fig, axes)
+    fig, axes = _chart_figure
+    for ax in axes:
+        ax.clear()
+    return fig, axes
+
+def _discard_chart_figure():
+    """Drop the shared figure so the next render rebuilds it (caller holds _CHART_LOCK)"""
+    global _chart_figure
+    _chart_figure = None
+
+# Most recent candles that must stay inside the swing range for the pattern to be valid
+SWING_CONFIRM_BARS = 5
+
+def _true_range(df: pd.DataFrame) -> np.ndarray:
+    """True range per candle as one NumPy pass; the first bar (no previous close) falls back to high - low"""
+    high = df['high'].to_numpy()
+    low = df['low'].to_numpy()
+    prev_close = df['close'].shift().to_numpy()
+    # fmax ignores NaN the way DataFrame.max(axis=1) skips it
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+def _fib_levels_dict(levels: np.ndarray) -> Dict[float, float]:
+    """Level array as the {ratio: price} dict carried by setups and alerts"""
+    return dict(zip(_FIB_RATIO_KEYS, levels.tolist()))
+
+def _closest_level(levels: np.ndarray, candidate_levels: List[float], price: float) -> Tuple[float, float]:
+    """(ratio, price) of the candidate level nearest to price, first one on ties"""
+    idx = [FIB_INDEX[lv] for lv in candidate_levels]
+    pos = int(np.argmin(np.abs(levels[idx] - price)))
+    return candidate_levels[pos], float(levels[idx[pos]])
+
+def _near_level(price, level, margin):
+    """Whether price is within `margin` (a fraction of the level) of level; broadcasts over price/level arrays"""
+    return np.abs(price - level) <= level * margin
+
+@njit(cache=True)
+def _fib_levels_nb(swing_high: float, swing_low: float, downtrend: bool,
+                   ratios: np.ndarray, out: np.ndarray) -> None:
+    """
+    Write the price of each Fibonacci ratio into `out`.
+    DOWNTREND: retracement UP from the swing low, 0% = Swing High, 100% = Swing Low.
+    UPTREND: retracement DOWN from the swing high, 0% = Swing Low, 100% = Swing High.
+    """
+    price_range = abs(swing_high - swing_low)
+    n = ratios.shape[0]
+    for i in range(n):
+        if downtrend:
+            # 61.8% retracement = Swing Low + 0.618 × (Swing High - Swing Low)
+            out[i] = swing_low + ratios[i] * price_range
+        else:
+            # 61.8% retracement = Swing High - 0.618 × (Swing High - Swing Low)
+            out[i] = swing_high - ratios[i] * price_range
+    # 0% / 100% are the start / end of the main move
+    if downtrend:
+        out[0] = swing_high
+        out[n - 1] = swing_low
+    else:
+        out[0] = swing_low
+        out[n - 1] = swing_high
+
+@lru_cache(maxsize=1024)
+def _fib_levels_cached(swing_high: float, swing_low: float, downtrend: bool) -> Tuple[float, ...]:
+    """Level prices for one swing pair; repeated scans and backtest windows keep landing on the same pivots"""
+    levels = np.empty(len(_FIB_RATIOS))
+    _fib_levels_nb(swing_high, swing_low, downtrend, _FIB_RATIOS, levels)
+    return tuple(levels.tolist())
+
+@njit(cache=True)
+def _fib_levels_batch_nb(swing_highs: np.ndarray, swing_lows: np.ndarray, downtrend: np.ndarray,
+                         ratios: np.ndarray, out: np.ndarray) -> None:
+    """Row k of `out` gets the Fibonacci levels of swing pair k (same formula as _fib_levels_nb)"""
+    for k in range(swing_highs.shape[0]):
+        _fib_levels_nb(swing_highs[k], swing_lows[k], downtrend[k], ratios, out[k])
+
+@njit(cache=True, boundscheck=False)
+def _detect_swing_points_nb(high: np.ndarray, low: np.ndarray, lookback: int,
+                            confirm_bars: int) -> Tuple[int, int]:
+    """
+    Single pass over the lookback window for the swing high/low positions.
+    The last `confirm_bars` candles are excluded from the search and instead checked
+    for a break of the swing range. Returns (-1, -1) when there is no valid swing.
+    """
+    n = high.shape[0]
+    start = max(0, n - lookback)
+    end = n - confirm_bars
+    if end - start < 2:
+        return -1, -1
+
+    hi_idx = start
+    lo_idx = start
+    for i in range(start + 1, end):
+        if high[i] > high[hi_idx]:
+            hi_idx = i
+        if low[i] < low[lo_idx]:
+            lo_idx = i
+    swing_high = high[hi_idx]
+    swing_low = low[lo_idx]
+    if swing_high <= swing_low:
+        return -1, -1
+
+    # Pattern is broken once a recent candle trades outside the swing range
+    for i in range(end, n):
+        if high[i] > swing_high or low[i] < swing_low:
+            return -1, -1
+    return hi_idx, lo_idx
+
 @dataclass
 class PivotPoint:
     """Data class for pivot points"""
@@ -111,6 +256,10 @@ class FibonacciDetector:
         plt.rcParams['xtick.color'] = CHART_COLORS['text']
         plt.rcParams['ytick.color'] = CHART_COLORS['text']
     
+    def _max_lookback(self, timeframe: str) -> int:
+        """Cap on candles used for swing detection and indicator history"""
+        return MAX_LOOKBACK_BARS.get(timeframe, DEFAULT_MAX_LOOKBACK)
+    
     def get_binance_data(self, symbol: str, interval: str, limit: int = 500) -> pd.DataFrame:
         """Fetch candlestick data from Binance API with fallback"""
         data_sources = [
@@ -148,19 +297,12 @@ class FibonacciDetector:
             
             data = response.json()
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            df.set_index('timestamp', inplace=True)
+            # Parse kline fields straight into typed arrays and build the DataFrame once
+            # (kline row: open time, open, high, low, close, volume, ...; prices are decimal strings)
+            ohlcv = np.array([row[1:6] for row in data], dtype=np.float64).reshape(-1, 5)
+            timestamps = pd.to_datetime(np.array([row[0] for row in data], dtype=np.int64), unit='ms')
+            df = pd.DataFrame(ohlcv, columns=['open', 'high', 'low', 'close', 'volume'],
+                              index=timestamps.rename('timestamp'))
             
             # Calculate technical indicators
             df = self._add_technical_indicators(df)
@@ -242,14 +384,7 @@ class FibonacciDetector:
             df['volume_ma'] = df['volume'].rolling(window=20).mean()
             
             # Average True Range for volatility
-            df['high_low'] = df['high'] - df['low']
-            df['high_close'] = np.abs(df['high'] - df['close'].shift())
-            df['low_close'] = np.abs(df['low'] - df['close'].shift())
-            df['true_range'] = df[['high_low', 'high_close', 'low_close']].max(axis=1)
-            df['atr'] = df['true_range'].rolling(window=14).mean()
-            
-            # Clean up temporary columns
-            df.drop(['high_low', 'high_close', 'low_close', 'true_range'], axis=1, inplace=True)
+            df['atr'] = pd.Series(_true_range(df), index=df.index).rolling(window=14).mean()
             
             return df
         except Exception as e:
@@ -276,33 +411,31 @@ class FibonacciDetector:
                 atr = recent_data['true_range'].rolling(window=atr_len).mean() if 'true_range' in recent_data.columns else None
                 if atr is None or atr.isna().all():
                     # Fallback ATR calc if not present
-                    high_low = recent_data['high'] - recent_data['low']
-                    high_close = (recent_data['high'] - recent_data['close'].shift()).abs()
-                    low_close = (recent_data['low'] - recent_data['close'].shift()).abs()
-                    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+                    tr = pd.Series(_true_range(recent_data), index=recent_data.index)
                     atr = tr.rolling(window=atr_len).mean()
 
                 dev_thresh_pct = (atr / recent_data['close']) * 100 * ZIGZAG_DEV_MULT
                 depth = max(2, ZIGZAG_DEPTH // 2)
 
                 pivots: List[Tuple[int, float, bool]] = []  # (index, price, isHigh)
+                highs = recent_data['high'].to_numpy()
+                lows = recent_data['low'].to_numpy()
+                thresholds = np.nan_to_num(dev_thresh_pct.to_numpy(dtype=float), nan=0.0)
                 last_price = recent_data['close'].iloc[0]
                 last_idx = recent_data.index[0]
                 last_is_high = None  # allow first pivot to be either high or low
 
                 for idx in range(depth, len(recent_data) - depth):
                     bar_idx = recent_data.index[idx]
-                    price_high = recent_data.iloc[idx]['high']
-                    price_low = recent_data.iloc[idx]['low']
-                    price_close = recent_data.iloc[idx]['close']
+                    price_high = highs[idx]
+                    price_low = lows[idx]
                     dev = 100 * (price_high - last_price) / max(price_high, 1e-9)
                     dev_low = 100 * (last_price - price_low) / max(last_price, 1e-9)
-                    thresh = dev_thresh_pct.iloc[idx] if not pd.isna(dev_thresh_pct.iloc[idx]) else 0
+                    thresh = thresholds[idx]
 
                     # Determine local high/low with depth and threshold
-                    window = recent_data.iloc[idx - depth: idx + depth + 1]
-                    is_local_high = price_high == window['high'].max()
-                    is_local_low = price_low == window['low'].min()
+                    is_local_high = price_high == highs[idx - depth: idx + depth + 1].max()
+                    is_local_low = price_low == lows[idx - depth: idx + depth + 1].min()
 
                     candidate = None
                     # dynamic thresholding for lenient mode
@@ -340,18 +473,20 @@ class FibonacciDetector:
             else:
                 pivot_highs: List[PivotPoint] = []
                 pivot_lows: List[PivotPoint] = []
+                highs = recent_data['high'].to_numpy()
+                lows = recent_data['low'].to_numpy()
                 for i in range(left_bars, len(recent_data) - right_bars):
                     current_idx = recent_data.index[i]
-                    current_high = recent_data.iloc[i]['high']
-                    current_low = recent_data.iloc[i]['low']
+                    current_high = highs[i]
+                    current_low = lows[i]
                     is_pivot_high = True
                     for j in range(i - left_bars, i + right_bars + 1):
-                        if j != i and recent_data.iloc[j]['high'] >= current_high:
+                        if j != i and highs[j] >= current_high:
                             is_pivot_high = False
                             break
                     is_pivot_low = True
                     for j in range(i - left_bars, i + right_bars + 1):
-                        if j != i and recent_data.iloc[j]['low'] <= current_low:
+                        if j != i and lows[j] <= current_low:
                             is_pivot_low = False
                             break
                     if is_pivot_high:
@@ -474,40 +609,21 @@ class FibonacciDetector:
         - For UPTREND: 0% = Swing Low (start), 100% = Swing High (end), retracement DOWN from high
         - For DOWNTREND: 0% = Swing High (start), 100% = Swing Low (end), retracement UP from low
         """
-        price_range = abs(swing_high - swing_low)
-        
-        if trend == "DOWNTREND":
-            # Main move: High -> Low (down move)
-            # Retracement: UP from the swing low
-            # 0% = Swing High (start of down move)
-            # 100% = Swing Low (end of down move)
-            # 61.8% retracement = Swing Low + 0.618 × (Swing High - Swing Low)
-            fib_levels = {
-                0.0: swing_high,    # 0% - Start of down move
-                0.236: swing_low + (0.236 * price_range),  # 23.6% retracement up
-                0.382: swing_low + (0.382 * price_range),  # 38.2% retracement up
-                0.5: swing_low + (0.5 * price_range),      # 50% retracement up
-                0.618: swing_low + (0.618 * price_range),  # 61.8% retracement up (KEY LEVEL)
-                0.786: swing_low + (0.786 * price_range),  # 78.6% retracement up
-                1.0: swing_low      # 100% - End of down move
-            }
-        else:
-            # Main move: Low -> High (up move)  
-            # Retracement: DOWN from the swing high
-            # 0% = Swing Low (start of up move)
-            # 100% = Swing High (end of up move)
-            # 61.8% retracement = Swing High - 0.618 × (Swing High - Swing Low)
-            fib_levels = {
-                0.0: swing_low,     # 0% - Start of up move
-                0.236: swing_high - (0.236 * price_range),  # 23.6% retracement down
-                0.382: swing_high - (0.382 * price_range),  # 38.2% retracement down
-                0.5: swing_high - (0.5 * price_range),      # 50% retracement down
-                0.618: swing_high - (0.618 * price_range),  # 61.8% retracement down (KEY LEVEL)
-                0.786: swing_high - (0.786 * price_range),  # 78.6% retracement down
-                1.0: swing_high     # 100% - End of up move
-            }
-        
-        return fib_levels
+        return dict(zip(_FIB_RATIO_KEYS, _fib_levels_cached(float(swing_high), float(swing_low), trend == "DOWNTREND")))
+    
+    def calculate_fibonacci_level_array(self, swing_high: float, swing_low: float, trend: str) -> np.ndarray:
+        """Fibonacci level prices as an array aligned with FIBONACCI_LEVELS (no dict wrapping)"""
+        return np.array(_fib_levels_cached(float(swing_high), float(swing_low), trend == "DOWNTREND"))
+    
+    def calculate_fibonacci_levels_batch(self, swing_highs: np.ndarray, swing_lows: np.ndarray,
+                                         downtrend: np.ndarray) -> np.ndarray:
+        """Fibonacci levels for many swing pairs at once, one row per pair aligned with FIBONACCI_LEVELS"""
+        swing_highs = np.ascontiguousarray(swing_highs, dtype=np.float64)
+        swing_lows = np.ascontiguousarray(swing_lows, dtype=np.float64)
+        downtrend = np.ascontiguousarray(downtrend, dtype=np.bool_)
+        levels = np.empty((len(swing_highs), len(_FIB_RATIOS)))
+        _fib_levels_batch_nb(swing_highs, swing_lows, downtrend, _FIB_RATIOS, levels)
+        return levels
     
     def check_confluence_factors(self, data: pd.DataFrame, fib_level: float, 
                                setup_type: str) -> Tuple[int, List[str]]:
@@ -595,16 +711,18 @@ class FibonacciDetector:
             # Look at historical highs and lows
             lookback_data = data.tail(200)
             historical_levels = []
+            highs = lookback_data['high'].to_numpy()
+            lows = lookback_data['low'].to_numpy()
             
             # Get significant highs and lows
             for i in range(10, len(lookback_data) - 10):
-                high = lookback_data.iloc[i]['high']
-                low = lookback_data.iloc[i]['low']
+                high = highs[i]
+                low = lows[i]
                 
                 # Check if it's a local high/low
-                if high == lookback_data.iloc[i-5:i+5]['high'].max():
+                if high == highs[i-5:i+5].max():
                     historical_levels.append(high)
-                if low == lookback_data.iloc[i-5:i+5]['low'].min():
+                if low == lows[i-5:i+5].min():
                     historical_levels.append(low)
             
             # Check if fib level aligns with any historical level
@@ -738,10 +856,10 @@ class FibonacciDetector:
         try:
             current_price = data['close'].iloc[-1]
             # Slightly widen tolerance in lenient mode
-            tolerance = fib_level * (margin * 1.5 if LENIENT_MODE else margin)
+            level_margin = margin * 1.5 if LENIENT_MODE else margin
             
             # 1. Price must be within tolerance of Fibonacci level
-            if abs(current_price - fib_level) > tolerance:
+            if not _near_level(current_price, fib_level, level_margin):
                 return False
             
             # 2. Multi-candle confirmation + respect of level
@@ -824,8 +942,7 @@ class FibonacciDetector:
             if setup_type == "LONG":
                 # Check for resistance above current price
                 resistance_levels = []
-                for i in range(len(recent_data)):
-                    high = recent_data.iloc[i]['high']
+                for high in recent_data['high'].to_numpy():
                     if high > current_price * 1.001:  # Above current price
                         resistance_levels.append(high)
                 
@@ -839,8 +956,7 @@ class FibonacciDetector:
             else:  # SHORT setup
                 # Check for support below current price
                 support_levels = []
-                for i in range(len(recent_data)):
-                    low = recent_data.iloc[i]['low']
+                for low in recent_data['low'].to_numpy():
                     if low < current_price * 0.999:  # Below current price
                         support_levels.append(low)
                 
@@ -862,33 +978,20 @@ class FibonacciDetector:
         Calculate professional trading levels with proper risk management
         """
         try:
-            if setup_type == "LONG":
-                # LONG setup: Buy near 61.8% support, target higher levels
-                entry = current_price
-                tp1 = fib_levels[0.5]      # First target: 50% level
-                tp2 = fib_levels[0.382]    # Second target: 38.2% level
-                tp3 = fib_levels[0.236]    # Third target: 23.6% level
-                
-                # Stop loss below 78.6% level with buffer
-                sl_base = fib_levels[0.786]
-                if atr:
-                    sl = sl_base - (atr * 0.5)  # Use ATR for dynamic stop
-                else:
-                    sl = sl_base * 0.995  # 0.5% buffer below 78.6%
-                
-            else:  # SHORT setup
-                # SHORT setup: Sell near 61.8% resistance, target lower levels (toward swing low)
-                entry = current_price
-                tp1 = fib_levels[0.5]      # 50% level (below entry)
-                tp2 = fib_levels[0.382]    # 38.2% level
-                tp3 = fib_levels[0.236]    # 23.6% level
-                
-                # Stop loss above 78.6% level with buffer
-                sl_base = fib_levels[0.786]
-                if atr:
-                    sl = sl_base + (atr * 0.5)
-                else:
-                    sl = sl_base * 1.005  # 0.5% buffer above 78.6%
+            # LONG buys near 61.8% support, SHORT sells near 61.8% resistance; both target the
+            # 50% / 38.2% / 23.6% levels and only the side of the stop differs
+            direction = 1.0 if setup_type == "LONG" else -1.0
+            entry = current_price
+            tp1 = fib_levels[0.5]      # First target: 50% level
+            tp2 = fib_levels[0.382]    # Second target: 38.2% level
+            tp3 = fib_levels[0.236]    # Third target: 23.6% level
+            
+            # Stop loss beyond the 78.6% level: below it for LONG, above it for SHORT
+            sl_base = fib_levels[0.786]
+            if atr:
+                sl = sl_base - direction * (atr * 0.5)  # Use ATR for dynamic stop
+            else:
+                sl = sl_base * (1 - direction * 0.005)  # 0.5% buffer
             
             # Calculate risk/reward ratios
             risk = abs(entry - sl)
@@ -926,8 +1029,8 @@ class FibonacciDetector:
         Professional 61.8% Fibonacci retracement detection with strict validation
         """
         try:
-            # 1. Fetch market data
-            data = self.get_binance_data(symbol, timeframe, 500)
+            # 1. Fetch market data (bounded history keeps per-cycle work constant)
+            data = self.get_binance_data(symbol, timeframe, self._max_lookback(timeframe))
             if data.empty or len(data) < (60 if LENIENT_MODE else 100):
                 logger.warning(f"Insufficient data for {symbol}")
                 return None
@@ -952,15 +1055,13 @@ class FibonacciDetector:
             
             # 5. Trend already computed
             
-            # 6. Calculate Fibonacci levels (CORRECTED LOGIC)
-            fib_levels = self.calculate_fibonacci_levels(swing_high.price, swing_low.price, trend)
+            # 6. Calculate Fibonacci levels (CORRECTED LOGIC); the ratio dict is only built for a setup
+            level_prices = self.calculate_fibonacci_level_array(swing_high.price, swing_low.price, trend)
             
             # 7. Check if current price is near a key Fibonacci level
             current_price = data['close'].iloc[-1]
             # Profile-driven allowed levels
-            candidate_levels = ALLOWED_FIB_LEVELS
-            closest_level = min(candidate_levels, key=lambda lv: abs(current_price - fib_levels[lv]))
-            closest_level_price = fib_levels[closest_level]
+            closest_level, closest_level_price = _closest_level(level_prices, ALLOWED_FIB_LEVELS, current_price)
 
             # Determine setup type based on trend and price context
             if trend == 'UPTREND':
@@ -984,7 +1085,7 @@ class FibonacciDetector:
             elif timeframe in ('1h','4h') and LENIENT_MODE:
                 base_margin = max(margin, max(0.006, margin))
             tolerance = closest_level_price * base_margin
-            if abs(current_price - closest_level_price) > tolerance:
+            if not _near_level(current_price, closest_level_price, base_margin):
                 lvl_pct = int(closest_level*100)
                 logger.info(f"Price {current_price:.4f} not at {lvl_pct}% level {closest_level_price:.4f} (±{tolerance:.4f})")
                 return None
@@ -1002,6 +1103,7 @@ class FibonacciDetector:
                 return None
             
             # 11. Calculate trading levels
+            fib_levels = _fib_levels_dict(level_prices)
             trading_levels = self.calculate_trading_levels(fib_levels, current_price, setup_type, atr)
             
             # 12. Validate risk/reward ratio
@@ -1075,22 +1177,57 @@ class FibonacciDetector:
         return result
 
     def run_detection_with_params(self, symbol: str, timeframe: str, margin: float,
-                                  min_move_percent: float, swing_lookback: int) -> Optional[Dict]:
-        """Legacy API shim: returns a dict compatible with notifier/monitors."""
+                                  min_move_percent: float, swing_lookback: int,
+                                  defer_chart: bool = False) -> Optional[Dict]:
+        """Legacy API shim: returns a dict compatible with notifier/monitors.
+        With defer_chart the chart renders in the background and is exposed as result['chart_future']."""
         try:
             setup = self.detect_618_retracement(symbol, timeframe, min_confluence=2, min_move_percent=min_move_percent)
             if not setup:
                 return None
             # Generate chart using current data
-            df = self.get_binance_data(symbol, timeframe, 500)
+            df = self.get_binance_data(symbol, timeframe, self._max_lookback(timeframe))
             if df.empty:
                 return self._setup_to_result(setup)
+            if defer_chart:
+                result = self._setup_to_result(setup)
+                result['chart_future'] = self.generate_chart_async(setup, df)
+                return result
             chart = self.generate_professional_chart(setup, df)
             return self._setup_to_result(setup, chart)
         except Exception as e:
             logger.error(f"Error in run_detection_with_params for {symbol}: {e}")
             return None
 
+    def check_618_retracement(self, current_price: float, fib_levels: Dict[float, float],
+                              margin: float = FALLBACK_MARGIN) -> bool:
+        """Legacy API shim: whether price sits at the 61.8% level within `margin` (fraction of the level)."""
+        return bool(_near_level(current_price, fib_levels[0.618], margin))
+
+    def detect_swing_points(self, df: pd.DataFrame, lookback: int = 50,
+                            arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """
+        Legacy API shim: index labels of the swing high/low, or (None, None) if missing or broken.
+        `arrays` may pass df's high/low columns as float64 arrays the caller already holds.
+        """
+        try:
+            if df.empty:
+                return None, None
+            lookback = min(lookback, self._max_lookback(df.attrs.get('timeframe')))
+            # The kernel applies the lookback itself, so no DataFrame window is sliced
+            if arrays is None:
+                high = df['high'].to_numpy(dtype=np.float64)
+                low = df['low'].to_numpy(dtype=np.float64)
+            else:
+                high, low = arrays
+            hi_idx, lo_idx = _detect_swing_points_nb(high, low, lookback, SWING_CONFIRM_BARS)
+            if hi_idx < 0 or lo_idx < 0:
+                return None, None
+            return df.index[hi_idx], df.index[lo_idx]
+        except Exception as e:
+            logger.error(f"Error detecting swing points: {e}")
+            return None, None
+
     def generate_chart(self, df: pd.DataFrame, swing_high_idx, swing_low_idx, 
                         fib_levels: Dict[float, float], current_price: float, symbol: str, timeframe: str, trend: str) -> Optional[str]:
         """Legacy API shim for chart generation. Builds a minimal setup and delegates to professional chart."""
@@ -1113,7 +1250,7 @@ class FibonacciDetector:
                 trend="UPTREND" if trend in ("UP", "UPTREND") else "DOWNTREND",
                 setup_type='LONG' if trend in ("UP", "UPTREND") else 'SHORT',
                 fibonacci_levels=fib_levels,
-                trading_levels={'entry': current_price, 'tp1': fib_levels.get(0.5, current_price), 'tp2': fib_levels.get(0.382, current_price), 'tp3': fib_levels.get(0.236, current_price), 'sl': fib_levels.get(0.786, current_price)},
+                trading_levels={'entry': current_price, 'tp1': fib_levels.get(0.5, current_price), 'tp2': fib_levels.get(0.382, current_price), 'tp3': fib_levels.get(0.236, current_price), 'sl': fib_levels.get(0.786, current_price), 'risk_amount': abs(current_price - fib_levels.get(0.786, current_price))},
                 confluences=0,
                 confidence='LOW',
                 risk_reward_ratio=0
@@ -1180,14 +1317,23 @@ class FibonacciDetector:
             logger.error(f"Error validating Fibonacci pattern: {e}")
             return False
     
+    def generate_chart_async(self, setup: FibonacciSetup, data: pd.DataFrame) -> Future:
+        """Render the chart on the background chart thread; the future resolves to the filename or None"""
+        return _CHART_EXECUTOR.submit(self.generate_professional_chart, setup, data)
+
     def generate_professional_chart(self, setup: FibonacciSetup, data: pd.DataFrame) -> Optional[str]:
         """
         Generate a professional trading chart with all relevant information
         """
+        # The figure is shared by every detector, so renders are serialized
+        with _CHART_LOCK:
+            return self._render_professional_chart(setup, data)
+    
+    def _render_professional_chart(self, setup: FibonacciSetup, data: pd.DataFrame) -> Optional[str]:
+        """Draw the chart on the shared figure and save it (caller holds _CHART_LOCK)"""
         try:
-            # Create figure with subplots for price and volume
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(CHART_WIDTH, CHART_HEIGHT), 
-                                         gridspec_kw={'height_ratios': [3, 1]}, dpi=DPI)
+            # Reuse the shared figure with subplots for price and volume
+            fig, (ax1, ax2) = _get_chart_axes()
             
             # Plot candlesticks on main chart
             plot_data = data.tail(200).copy()
@@ -1302,25 +1448,23 @@ class FibonacciDetector:
             
             # Volume subplot
             if 'volume' in plot_data.columns:
-                volume_colors = ['green' if plot_data.iloc[i]['close'] >= plot_data.iloc[i]['open'] 
-                               else 'red' for i in range(len(plot_data))]
+                volume_colors = np.where(plot_data['close'].to_numpy() >= plot_data['open'].to_numpy(),
+                                         'green', 'red').tolist()
                 ax2.bar(range(len(plot_data)), plot_data['volume'], color=volume_colors, alpha=0.7)
                 ax2.set_ylabel('Volume', color=CHART_COLORS['text'], fontsize=10)
                 ax2.set_facecolor(CHART_COLORS['background'])
                 ax2.grid(True, alpha=0.3, color=CHART_COLORS['grid'])
             
-            # Format and save
-            plt.tight_layout()
+            # Save
             filename = f"fibonacci_618_setup_{setup.symbol}_{setup.timeframe}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            plt.savefig(filename, facecolor=CHART_COLORS['background'], bbox_inches='tight', dpi=DPI)
-            plt.close()
+            fig.savefig(filename, facecolor=CHART_COLORS['background'], bbox_inches='tight', dpi=DPI)
             
             logger.info(f"Professional chart saved as {filename}")
             return filename
             
         except Exception as e:
             logger.error(f"Error generating professional chart: {e}")
-            plt.close('all')  # Clean up any open figures
+            _discard_chart_figure()  # Rebuild the figure next time in case it was left half-drawn
             return None
     
     def scan_multiple_symbols(self, symbols: List[str], timeframes: List[str], 
@@ -1437,12 +1581,11 @@ class FibonacciDetector:
                         continue
 
                     # trend already determined above
-                    fib_levels = self.calculate_fibonacci_levels(swing_high.price, swing_low.price, trend)
+                    level_prices = self.calculate_fibonacci_level_array(swing_high.price, swing_low.price, trend)
 
                     current_price = sub_df['close'].iloc[-1]
                     candidate_levels = [0.618] if not LENIENT_MODE else [0.618, 0.5, 0.382, 0.786]
-                    closest_level = min(candidate_levels, key=lambda lv: abs(current_price - fib_levels[lv]))
-                    closest_level_price = fib_levels[closest_level]
+                    closest_level, closest_level_price = _closest_level(level_prices, candidate_levels, current_price)
 
                     atr = sub_df['atr'].iloc[-1] if 'atr' in sub_df.columns and not pd.isna(sub_df['atr'].iloc[-1]) else None
                     if atr and atr > 0:
@@ -1452,8 +1595,7 @@ class FibonacciDetector:
                     base_margin = margin
                     if timeframe in ('1m', '5m', '15m'):
                         base_margin = max(margin, 0.003 if LENIENT_MODE else 0.0015)
-                    tolerance = closest_level_price * base_margin
-                    if abs(current_price - closest_level_price) > tolerance:
+                    if not _near_level(current_price, closest_level_price, base_margin):
                         continue
 
                     # Setup type
@@ -1472,6 +1614,7 @@ class FibonacciDetector:
                     if confluence_count < required_confluences:
                         continue
 
+                    fib_levels = _fib_levels_dict(level_prices)
                     trading_levels = self.calculate_trading_levels(fib_levels, current_price, setup_type, atr)
                     min_rr = 1.0 if LENIENT_MODE else 1.5
                     if trading_levels.get('risk_reward_1', 0) < min_rr:
@@ -106,9 +106,10 @@ class FibonacciBotConsole:
         print(f"Total Move: {move_percent:.2f}%")
         
         print(f"\n📊 FIBONACCI LEVELS:")
-        for level, price in fib_levels.items():
-            marker = " ⭐" if level == 0.618 else ""
-            print(f"{FIBONACCI_LEVELS[level]}: ${price:.2f}{marker}")
+        print("\n".join(
+            f"{FIBONACCI_LEVELS[level]}: ${price:.2f}{' ⭐' if level == 0.618 else ''}"
+            for level, price in fib_levels.items()
+        ))
         
         print(f"\n💰 TRADING LEVELS:")
         print(f"Entry: ${trading_levels['entry']:.2f}")
@@ -60,7 +60,8 @@ class SingleMonitor:
                 timeframe=self.config.timeframe,
                 margin=self.config.margin,
                 min_move_percent=self.config.min_move_percent,
-                swing_lookback=self.config.swing_lookback
+                swing_lookback=self.config.swing_lookback,
+                defer_chart=True
             )
             
             if result is None:
@@ -15,10 +15,17 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _get_detector():
+    """Shared FibonacciDetector for candle lookups, built on first use (its constructor restyles matplotlib)"""
+    from fibonacci_detector import FibonacciDetector
+    return FibonacciDetector()
+
 class PositionStatus(Enum):
     PENDING = "PENDING"      # Setup detected, waiting for entry
     ACTIVE = "ACTIVE"        # Position opened, monitoring
@@ -130,8 +137,7 @@ class PositionManager:
         """Validate candle pattern according to strategy"""
         try:
             # Get the latest candle data
-            from fibonacci_detector import FibonacciDetector
-            detector = FibonacciDetector()
+            detector = _get_detector()
             
             symbol = detection_result['symbol']
             timeframe = detection_result['timeframe']
@@ -177,8 +183,7 @@ class PositionManager:
     def _calculate_strategy_stop_loss(self, detection_result: Dict, setup_type: str) -> float:
         """Calculate stop loss based on strategy: 'a little above the high of the candle where the deal was opened'"""
         try:
-            from fibonacci_detector import FibonacciDetector
-            detector = FibonacciDetector()
+            detector = _get_detector()
             
             symbol = detection_result['symbol']
             timeframe = detection_result['timeframe']
@@ -4,15 +4,10 @@ Test script for Gemini Setup Filter
 This script demonstrates how the AI quality filter works
 """
 
-import os
-import sys
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Add the current directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from gemini_filter import GeminiSetupFilter
 
 # Set up logging
@@ -3,15 +3,10 @@
 Test script to verify Discord notifications are working
 """
 
-import os
-import sys
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Add the current directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from discord_notifier import DiscordNotifier
 
 # Set up logging
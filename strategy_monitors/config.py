@@ -11,6 +11,8 @@ MARGIN = 0.002  # ±0.2% tolerance for 0.618 level
 MIN_MOVE_PERCENT = 0.03  # 3% minimum move from swing low to high
 SWING_LOOKBACK = 50  # Number of candles to look back for swing detection
 CHECK_INTERVAL_MINUTES = 5  # How often to check for setups
+DETECTION_WORKERS = 8  # Threads used to run monitors' detections in parallel
+CANDLE_CLOSE_BUFFER_SECONDS = 2  # Wait after a candle closes so Binance has finalized the kline
 
 # Fibonacci Levels
 FIBONACCI_LEVELS = {
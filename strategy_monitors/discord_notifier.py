@@ -1,14 +1,51 @@
 import requests
 import json
-from datetime import datetime
-from typing import Dict, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 import logging
 from config import *
+from http_session import create_session
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections to the Discord webhook shared by every notifier
+_SESSION = create_session(retry_post=True)
+
+# Seconds to wait on a webhook call before giving up
+WEBHOOK_TIMEOUT = 30
+
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+EMBED_COLORS = {'BULLISH': 0x00ff88, 'BEARISH': 0xff4444}
+EMBED_COLOR_NEUTRAL = 0xffa726
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Explanation and risk disclaimer carried by every strategy alert embed
+_STRATEGY_EMBED_DESCRIPTION = """**📋 Strategy Explanation:**
+This signal indicates a potential trading opportunity based on technical analysis. Always confirm with additional indicators and market context.
+
+**⚠️ Risk Management:**
+• Always use proper position sizing
+• Set stop loss to limit potential losses
+• Consider market conditions and overall trend
+• This is not financial advice - trade at your own risk"""
+
+def _dumps(payload: Dict) -> bytes:
+    """Serialize a webhook payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
 class DiscordNotifier:
     def __init__(self):
+        self.session = _SESSION
         self.webhook_url = DISCORD_WEBHOOK_URL
         self.username = DISCORD_USERNAME
         self.avatar_url = DISCORD_AVATAR_URL
@@ -39,10 +76,11 @@ class DiscordNotifier:
                 'content': message
             }
             
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 data={'payload_json': json.dumps(payload)},
-                files=files
+                files=files,
+                timeout=WEBHOOK_TIMEOUT
             )
             
             if response.status_code == 204:
@@ -58,37 +96,43 @@ class DiscordNotifier:
     
     def send_strategy_alert(self, strategy_signal: Dict) -> bool:
         """Send Discord alert with strategy signal information"""
+        return self.send_strategy_alerts_batch([strategy_signal])
+    
+    def send_strategy_alerts_batch(self, strategy_signals: List[Dict]) -> bool:
+        """Send strategy signals as embeds, packing up to 10 signals per webhook call"""
         try:
             if not self.webhook_url:
                 logger.error("Discord webhook URL not configured")
                 return False
             
-            # Prepare the message
-            message = self._create_strategy_message(strategy_signal)
+            embeds = [self._create_strategy_embed(signal) for signal in strategy_signals]
+            all_sent = True
             
-            # Send webhook
-            payload = {
-                'username': 'Strategy Monitor',
-                'avatar_url': self.avatar_url,
-                'content': message
-            }
-            
-            response = requests.post(
-                self.webhook_url,
-                json=payload
-            )
+            for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+                payload = {
+                    'username': 'Strategy Monitor',
+                    'avatar_url': self.avatar_url,
+                    'embeds': embeds[start:start + MAX_EMBEDS_PER_MESSAGE]
+                }
+                
+                response = self._post_json(payload)
+                
+                if response.status_code == 204:
+                    logger.info(f"Strategy Discord batch sent successfully ({len(payload['embeds'])} signals)")
+                else:
+                    logger.error(f"Failed to send strategy Discord batch: {response.status_code} - {response.text}")
+                    all_sent = False
             
-            if response.status_code == 204:
-                logger.info("Strategy Discord alert sent successfully")
-                return True
-            else:
-                logger.error(f"Failed to send strategy Discord alert: {response.status_code} - {response.text}")
-                return False
+            return all_sent
                 
         except Exception as e:
-            logger.error(f"Error sending strategy Discord alert: {e}")
+            logger.error(f"Error sending strategy Discord batch: {e}")
             return False
     
+    def _post_json(self, payload: Dict) -> requests.Response:
+        """POST a JSON payload to the webhook"""
+        return self.session.post(self.webhook_url, data=_dumps(payload), headers=_JSON_HEADERS, timeout=WEBHOOK_TIMEOUT)
+    
     def _create_message(self, result: Dict) -> str:
         """Create formatted Discord message for Fibonacci alerts"""
         symbol = result['symbol']
@@ -173,110 +217,71 @@ The price has retraced to the 61.8% Fibonacci level, which is a key support/resi
         
         return message.strip()
     
-    def _create_strategy_message(self, signal: Dict) -> str:
-        """Create formatted Discord message for strategy alerts"""
+    def _strategy_details(self, signal: Dict) -> List[Tuple[str, str]]:
+        """Strategy-specific (name, value) pairs for a signal's embed fields"""
         strategy = signal['strategy']
-        signal_type = signal['type']
-        signal_name = signal['signal']
-        price = signal['price']
-        confidence = signal['confidence']
-        symbol = signal['symbol']
-        timeframe = signal['timeframe']
-        monitor_name = signal.get('monitor_name', 'Strategy Monitor')
-        
-        # Create emoji based on signal type
-        if signal_type == 'BULLISH':
-            emoji = "🟢"
-        elif signal_type == 'BEARISH':
-            emoji = "🔴"
-        else:
-            emoji = "🟡"
         
-        message = f"""
-{emoji} **STRATEGY SIGNAL DETECTED** {emoji}
-
-**Monitor:** {monitor_name}
-**Strategy:** {strategy}
-**Signal:** {signal_name}
-**Type:** {signal_type}
-**Confidence:** {confidence}
-
-**📊 Signal Details:**
-• Symbol: {symbol}
-• Timeframe: {timeframe}
-• Current Price: ${price:.2f}
-"""
-        
-        # Add strategy-specific details
         if strategy == 'Support/Resistance Break':
-            level = signal.get('level', 0)
-            volume_ratio = signal.get('volume_ratio', 0)
-            message += f"""
-• Break Level: ${level:.2f}
-• Volume Ratio: {volume_ratio:.2f}x
-"""
-        elif strategy == 'Moving Average Crossover':
-            sma_cross = signal.get('sma_cross', False)
-            ema_cross = signal.get('ema_cross', False)
-            message += f"""
-• SMA Crossover: {'Yes' if sma_cross else 'No'}
-• EMA Crossover: {'Yes' if ema_cross else 'No'}
-"""
-        elif strategy == 'RSI Divergence':
-            rsi = signal.get('rsi', 0)
-            message += f"""
-• Current RSI: {rsi:.2f}
-"""
-        elif strategy == 'MACD Crossover':
-            macd = signal.get('macd', 0)
-            signal_line = signal.get('signal_line', 0)
-            message += f"""
-• MACD: {macd:.4f}
-• Signal Line: {signal_line:.4f}
-"""
-        elif strategy == 'Bollinger Band Squeeze':
-            bandwidth = signal.get('bandwidth', 0)
-            upper_band = signal.get('upper_band', 0)
-            lower_band = signal.get('lower_band', 0)
-            message += f"""
-• Bandwidth: {bandwidth:.3f}
-• Upper Band: ${upper_band:.2f}
-• Lower Band: ${lower_band:.2f}
-"""
-        elif 'STRAT_' in strategy:
+            return [
+                ('Break Level', f"${signal.get('level', 0):.2f}"),
+                ('Volume Ratio', f"{signal.get('volume_ratio', 0):.2f}x"),
+            ]
+        if strategy == 'Moving Average Crossover':
+            return [
+                ('SMA Crossover', 'Yes' if signal.get('sma_cross', False) else 'No'),
+                ('EMA Crossover', 'Yes' if signal.get('ema_cross', False) else 'No'),
+            ]
+        if strategy == 'RSI Divergence':
+            return [('Current RSI', f"{signal.get('rsi', 0):.2f}")]
+        if strategy == 'MACD Crossover':
+            return [
+                ('MACD', f"{signal.get('macd', 0):.4f}"),
+                ('Signal Line', f"{signal.get('signal_line', 0):.4f}"),
+            ]
+        if strategy.startswith('Bollinger Band'):
+            # Breakouts only carry the band that was broken
+            details = [('Bandwidth', f"{signal.get('bandwidth', 0):.3f}")]
+            if 'upper_band' in signal:
+                details.append(('Upper Band', f"${signal['upper_band']:.2f}"))
+            if 'lower_band' in signal:
+                details.append(('Lower Band', f"${signal['lower_band']:.2f}"))
+            return details
+        if 'STRAT_' in strategy:
             # Strat Strategy (Rob Smith) details
-            volume_ratio = signal.get('volume_ratio', 0)
-            trend = signal.get('trend', 'UNKNOWN')
-            
             if 'BREAKOUT' in strategy:
-                breakout_level = signal.get('breakout_level', 0)
-                message += f"""
-• Breakout Level: ${breakout_level:.2f}
-• Volume Ratio: {volume_ratio:.2f}x
-• Trend: {trend}
-"""
+                level = ('Breakout Level', f"${signal.get('breakout_level', 0):.2f}")
             elif 'BOUNCE' in strategy or 'REJECTION' in strategy:
-                level = signal.get('level', 0)
-                message += f"""
-• Key Level: ${level:.2f}
-• Volume Ratio: {volume_ratio:.2f}x
-• Trend: {trend}
-"""
+                level = ('Key Level', f"${signal.get('level', 0):.2f}")
+            else:
+                return []
+            return [
+                level,
+                ('Volume Ratio', f"{signal.get('volume_ratio', 0):.2f}x"),
+                ('Trend', signal.get('trend', 'UNKNOWN')),
+            ]
+        return []
+    
+    def _create_strategy_embed(self, signal: Dict) -> Dict:
+        """Create a compact Discord embed for one strategy signal"""
+        signal_type = signal['type']
         
-        message += f"""
-**📋 Strategy Explanation:**
-This signal indicates a potential trading opportunity based on technical analysis. Always confirm with additional indicators and market context.
-
-**⚠️ Risk Management:**
-• Always use proper position sizing
-• Set stop loss to limit potential losses
-• Consider market conditions and overall trend
-• This is not financial advice - trade at your own risk
-
-**⏰ Detected at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-"""
+        fields = [
+            {'name': 'Monitor', 'value': signal.get('monitor_name', 'Strategy Monitor'), 'inline': True},
+            {'name': 'Symbol', 'value': f"{signal['symbol']} {signal['timeframe']}", 'inline': True},
+            {'name': 'Price', 'value': f"${signal['price']:.2f}", 'inline': True},
+            {'name': 'Type', 'value': signal_type, 'inline': True},
+            {'name': 'Confidence', 'value': str(signal['confidence']), 'inline': True},
+        ]
+        fields.extend({'name': name, 'value': value, 'inline': True} for name, value in self._strategy_details(signal))
         
-        return message.strip()
+        return {
+            'title': f"{signal['strategy']}: {signal['signal']}",
+            'description': _STRATEGY_EMBED_DESCRIPTION,
+            'color': EMBED_COLORS.get(signal_type, EMBED_COLOR_NEUTRAL),
+            'fields': fields,
+            # Discord reads the ISO timestamp as UTC unless it carries an offset
+            'timestamp': signal.get('timestamp', datetime.now(timezone.utc)).isoformat()
+        }
     
     def send_test_message(self) -> bool:
         """Send a test message to verify Discord webhook is working"""
@@ -304,10 +309,7 @@ If you received this message, the bot is properly configured and ready to send a
                 'content': test_message.strip()
             }
             
-            response = requests.post(
-                self.webhook_url,
-                json=payload
-            )
+            response = self._post_json(payload)
             
             if response.status_code == 204:
                 logger.info("Discord test message sent successfully")
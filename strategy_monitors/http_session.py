@@ -0,0 +1,16 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def create_session(retry_post: bool = False) -> requests.Session:
+    """Create an HTTP session with pooled keep-alive connections and retries on transient errors"""
+    session = requests.Session()
+    if retry_post:
+        # POSTs are only resent when rate limited (429, after Retry-After): Discord rejected those unprocessed,
+        # whereas after a 5xx or a read timeout the message may already have been posted
+        retry = Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=[429], allowed_methods=None)
+    else:
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
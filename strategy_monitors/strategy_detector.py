@@ -17,16 +17,20 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
-import requests
 import json
 from typing import Dict, List, Optional, Tuple
 import logging
 from dataclasses import dataclass
 
+from http_session import create_session
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections to Binance shared by every detector call
+_SESSION = create_session()
+
 @dataclass
 class StrategyConfig:
     """Configuration for a trading strategy"""
@@ -59,24 +63,24 @@ class StrategyDetector:
                 'limit': limit
             }
             
-            response = requests.get(url, params=params)
+            response = _SESSION.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            df.set_index('timestamp', inplace=True)
+            # Parse kline fields straight into typed arrays and build the DataFrame once
+            # (kline row: open time, open, high, low, close, volume, ...; prices are decimal strings)
+            ohlcv = np.array([row[1:6] for row in data], dtype=np.float64).reshape(-1, 5)
+            # float32 prices halve the memory the indicator passes stream through
+            prices = ohlcv[:, :4].astype(np.float32)
+            timestamps = pd.to_datetime(np.array([row[0] for row in data], dtype=np.int64), unit='ms')
+            df = pd.DataFrame({
+                'open': prices[:, 0],
+                'high': prices[:, 1],
+                'low': prices[:, 2],
+                'close': prices[:, 3],
+                'volume': ohlcv[:, 4],
+            }, index=timestamps.rename('timestamp'))
             return df
             
         except Exception as e:
@@ -465,12 +469,19 @@ class StrategyDetector:
 
     def run_strategy_detection(self, symbol: str, timeframe: str) -> List[Dict]:
         """Run all strategy detections"""
+        return self.detect_strategies(symbol, timeframe) or []
+    
+    def detect_strategies(self, symbol: str, timeframe: str) -> Optional[List[Dict]]:
+        """Run all strategy detections; None if the data could not be fetched or analysed"""
         try:
-            # Fetch data
-            df = self.get_binance_data(symbol, timeframe, 100)
+            # Fetch data (one extra kline: Binance always ends with the candle that has just opened)
+            df = self.get_binance_data(symbol, timeframe, 101)
             if df.empty:
                 logger.error(f"Failed to fetch data for {symbol}")
-                return []
+                return None
+            
+            # Detect on the candle that just closed, not the seconds-old one still forming
+            df = df.iloc[:-1]
             
             # Calculate indicators
             df = self.calculate_indicators(df)
@@ -512,7 +523,7 @@ class StrategyDetector:
             
         except Exception as e:
             logger.error(f"Error in strategy detection for {symbol}: {e}")
-            return []
+            return None
 
 if __name__ == "__main__":
     # Test the strategy detector
@@ -14,11 +14,11 @@ This script runs multiple strategy detectors simultaneously:
 import time
 import schedule
 import logging
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from strategy_detector import StrategyDetector, StrategyConfig
 from discord_notifier import DiscordNotifier
@@ -35,62 +35,130 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Timeframes monitored per coin (quoted against USDT)
+STRATEGY_MONITORS = {
+    'SOL': ['1h', '4h', '1d'],
+    'BTC': ['1h', '4h'],
+    'ETH': ['1h', '4h'],
+    'ADA': ['1h', '4h'],
+    'DOT': ['1h', '4h'],
+}
+
+# Coins/timeframes with a dedicated Strat Strategy (Rob Smith) monitor
+STRAT_MONITORS = {
+    'SOL': ['1h', '4h'],
+    'BTC': ['1h', '4h'],
+    'ETH': ['1h', '4h'],
+}
+
+# Candle length per timeframe; monitors only re-run once a new candle has closed
+TIMEFRAME_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '8h': 28800, '12h': 43200,
+    '1d': 86400,
+}
+
+def next_close_time(tf: str, now: Optional[datetime] = None) -> datetime:
+    """Return the UTC close time of the candle currently forming on timeframe tf"""
+    now = now or datetime.now(timezone.utc)
+    interval = TIMEFRAME_SECONDS[tf]
+    return datetime.fromtimestamp((now.timestamp() // interval + 1) * interval, tz=timezone.utc)
+
+# Discord startup announcement; only the monitor count and start time vary
+_STARTUP_TPL = """🚀 **STRATEGY MONITOR STARTED** 🚀
+
+**Active Strategy Monitors:** {n}
+
+**📊 Strategy Types:**
+• Support/Resistance Breaks
+• Moving Average Crossovers
+• RSI Divergences
+• MACD Crossovers
+• Bollinger Band Squeezes
+
+**📈 Monitoring Active:**
+All strategy monitors are now running and will send alerts when trading setups are detected.
+
+**⏰ Started at:** {ts} UTC"""
+
 class SingleStrategyMonitor:
     """Individual strategy monitor instance"""
-    def __init__(self, config: StrategyConfig, notifier: DiscordNotifier):
+    def __init__(self, config: StrategyConfig, notifier: DiscordNotifier, detector: StrategyDetector):
+        # Scheduling needs the candle length, so an unknown timeframe is rejected here rather than on every tick
+        if config.timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unsupported timeframe '{config.timeframe}' for monitor '{config.name}'")
         self.config = config
         self.notifier = notifier
-        self.detector = StrategyDetector()
+        self.detector = detector
         self.last_alert_time = None
         self.alert_cooldown = timedelta(minutes=30)
+        self.next_check = None  # None = run on the first tick
         
-        logger.info(f"Strategy Monitor '{config.name}' initialized: {config.symbol} {config.timeframe}")
+        logger.info("Strategy Monitor '%s' initialized: %s %s", config.name, config.symbol, config.timeframe)
+    
+    def is_due(self, now: datetime) -> bool:
+        """Whether a new candle has closed since the last completed check"""
+        return self.next_check is None or now >= self.next_check
     
     def check_strategies(self) -> None:
         """Check for strategy setups with this monitor's configuration"""
         try:
-            logger.info(f"[{self.config.name}] Checking strategies for {self.config.symbol} on {self.config.timeframe}...")
+            # One timestamp per check: shared by every signal and the cooldown
+            current_time = datetime.now(timezone.utc)
+            current_tick = time.monotonic()
+            
+            logger.info("[%s] Checking strategies for %s on %s...", self.config.name, self.config.symbol, self.config.timeframe)
             
             # Run strategy detection
-            signals = self.detector.run_strategy_detection(self.config.symbol, self.config.timeframe)
+            signals = self.detector.detect_strategies(self.config.symbol, self.config.timeframe)
+            if signals is None:
+                # Fetch or analysis failed: leave next_check alone so the next tick retries
+                logger.warning("[%s] No data analysed, retrying on the next tick", self.config.name)
+                return
+            
+            # Nothing new to see until the current candle closes
+            self.next_check = (next_close_time(self.config.timeframe) +
+                               timedelta(seconds=CANDLE_CLOSE_BUFFER_SECONDS))
             
             if not signals:
-                logger.info(f"[{self.config.name}] No strategy signals detected")
+                logger.info("[%s] No strategy signals detected", self.config.name)
                 return
             
-            # Check cooldown
-            current_time = datetime.now()
+            # Check cooldown (monotonic clock, immune to wall-clock adjustments)
             if (self.last_alert_time is None or 
-                current_time - self.last_alert_time > self.alert_cooldown):
+                current_tick - self.last_alert_time > self.alert_cooldown.total_seconds()):
                 
-                logger.info(f"[{self.config.name}] 🚨 STRATEGY SIGNALS DETECTED!")
+                logger.info("[%s] 🚨 STRATEGY SIGNALS DETECTED!", self.config.name)
                 
-                # Send alerts for each signal
+                # Add monitor info to each signal
                 for signal in signals:
-                    # Add monitor info to signal
                     signal['monitor_name'] = self.config.name
                     signal['symbol'] = self.config.symbol
                     signal['timeframe'] = self.config.timeframe
-                    signal['timestamp'] = datetime.now()
-                    
-                    # Send Discord alert
-                    if self.notifier.send_strategy_alert(signal):
-                        logger.info(f"[{self.config.name}] Strategy alert sent: {signal['strategy']}")
-                    else:
-                        logger.error(f"[{self.config.name}] Failed to send strategy alert")
+                    signal['timestamp'] = current_time
+                
+                # Send all of this tick's signals together (batched into Discord embeds)
+                if self.notifier.send_strategy_alerts_batch(signals):
+                    logger.info("[%s] Strategy alerts sent: %s", self.config.name,
+                                ", ".join(signal['strategy'] for signal in signals))
+                else:
+                    logger.error("[%s] Failed to send strategy alerts", self.config.name)
                 
-                self.last_alert_time = current_time
+                self.last_alert_time = current_tick
             else:
-                logger.info(f"[{self.config.name}] Alerts suppressed (cooldown)")
+                logger.info("[%s] Alerts suppressed (cooldown)", self.config.name)
                 
         except Exception as e:
-            logger.error(f"[{self.config.name}] Error in strategy check: {e}")
+            logger.error("[%s] Error in strategy check: %s", self.config.name, e)
 
 class StrategyMonitor:
     """Main class that manages multiple strategy monitors"""
     
     def __init__(self):
         self.notifier = DiscordNotifier()
+        # One detector shared by every monitor (it holds no per-symbol state)
+        self.detector = StrategyDetector()
+        self.executor = ThreadPoolExecutor(max_workers=DETECTION_WORKERS)
         self.monitors: List[SingleStrategyMonitor] = []
         self.strategy_configs = self._create_strategy_configs()
         self._initialize_monitors()
@@ -99,133 +167,28 @@ class StrategyMonitor:
     
     def _create_strategy_configs(self) -> List[StrategyConfig]:
         """Create configurations for all strategy monitors"""
-        configs = []
-        
-        # SOL Strategy monitors
-        configs.extend([
+        configs = [
             StrategyConfig(
-                name="SOL-1H-Strategies",
-                symbol="SOLUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="SOL-4H-Strategies",
-                symbol="SOLUSDT",
-                timeframe="4h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="SOL-1D-Strategies",
-                symbol="SOLUSDT",
-                timeframe="1d",
+                name=f"{coin}-{tf.upper()}-Strategies",
+                symbol=f"{coin}USDT",
+                timeframe=tf,
                 enabled=True
             )
-        ])
-        
-        # BTC Strategy monitors
-        configs.extend([
-            StrategyConfig(
-                name="BTC-1H-Strategies",
-                symbol="BTCUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="BTC-4H-Strategies",
-                symbol="BTCUSDT",
-                timeframe="4h",
-                enabled=True
-            )
-        ])
-        
-        # ETH Strategy monitors
-        configs.extend([
-            StrategyConfig(
-                name="ETH-1H-Strategies",
-                symbol="ETHUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="ETH-4H-Strategies",
-                symbol="ETHUSDT",
-                timeframe="4h",
-                enabled=True
-            )
-        ])
-        
-        # ADA Strategy monitors
-        configs.extend([
-            StrategyConfig(
-                name="ADA-1H-Strategies",
-                symbol="ADAUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="ADA-4H-Strategies",
-                symbol="ADAUSDT",
-                timeframe="4h",
-                enabled=True
-            )
-        ])
-        
-        # DOT Strategy monitors
-        configs.extend([
-            StrategyConfig(
-                name="DOT-1H-Strategies",
-                symbol="DOTUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="DOT-4H-Strategies",
-                symbol="DOTUSDT",
-                timeframe="4h",
-                enabled=True
-            )
-        ])
+            for coin, timeframes in STRATEGY_MONITORS.items()
+            for tf in timeframes
+        ]
         
         # Strat Strategy (Rob Smith) monitors - dedicated monitors for strat strategy
-        configs.extend([
-            StrategyConfig(
-                name="SOL-STRAT-1H",
-                symbol="SOLUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="SOL-STRAT-4H",
-                symbol="SOLUSDT",
-                timeframe="4h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="BTC-STRAT-1H",
-                symbol="BTCUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="BTC-STRAT-4H",
-                symbol="BTCUSDT",
-                timeframe="4h",
-                enabled=True
-            ),
-            StrategyConfig(
-                name="ETH-STRAT-1H",
-                symbol="ETHUSDT",
-                timeframe="1h",
-                enabled=True
-            ),
+        configs.extend(
             StrategyConfig(
-                name="ETH-STRAT-4H",
-                symbol="ETHUSDT",
-                timeframe="4h",
+                name=f"{coin}-STRAT-{tf.upper()}",
+                symbol=f"{coin}USDT",
+                timeframe=tf,
                 enabled=True
             )
-        ])
+            for coin, timeframes in STRAT_MONITORS.items()
+            for tf in timeframes
+        )
         
         return configs
     
@@ -233,14 +196,24 @@ class StrategyMonitor:
         """Initialize all strategy monitors"""
         for config in self.strategy_configs:
             if config.enabled:
-                monitor = SingleStrategyMonitor(config, self.notifier)
+                monitor = SingleStrategyMonitor(config, self.notifier, self.detector)
                 self.monitors.append(monitor)
     
-    def _schedule_monitor(self, monitor: SingleStrategyMonitor) -> None:
-        """Schedule a single monitor to run"""
-        # Schedule to run every 5 minutes
-        schedule.every(5).minutes.do(monitor.check_strategies)
-        logger.info(f"Scheduled '{monitor.config.name}' every 5 minutes")
+    def check_all_strategies(self) -> None:
+        """Run the checks of monitors whose candle has closed concurrently on the shared thread pool"""
+        now = datetime.now(timezone.utc)
+        due = [monitor for monitor in self.monitors if monitor.is_due(now)]
+        if due:
+            list(self.executor.map(lambda m: m.check_strategies(), due))
+    
+    def _schedule_monitors(self) -> None:
+        """Schedule all monitors to run together"""
+        # Tick every minute; each monitor only runs once its candle has closed
+        schedule.every(1).minutes.do(self.check_all_strategies)
+        # Per-monitor lines are only worth building when INFO is actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            for monitor in self.monitors:
+                logger.info("Scheduled '%s' on %s candle closes", monitor.config.name, monitor.config.timeframe)
     
     def send_startup_message(self) -> None:
         """Send startup message to Discord"""
@@ -248,32 +221,16 @@ class StrategyMonitor:
             logger.warning("Discord webhook not configured - alerts will be console only")
             return
         
-        message = f"""
-🚀 **STRATEGY MONITOR STARTED** 🚀
-
-**Active Strategy Monitors:** {len(self.monitors)}
-
-**📊 Strategy Types:**
-• Support/Resistance Breaks
-• Moving Average Crossovers
-• RSI Divergences
-• MACD Crossovers
-• Bollinger Band Squeezes
-
-**📈 Monitoring Active:**
-All strategy monitors are now running and will send alerts when trading setups are detected.
-
-**⏰ Started at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
-"""
+        message = _STARTUP_TPL.format(n=len(self.monitors), ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         
         try:
             payload = {
                 'username': 'Strategy Monitor',
                 'avatar_url': DISCORD_AVATAR_URL,
-                'content': message.strip()
+                'content': message
             }
             
-            response = requests.post(DISCORD_WEBHOOK_URL, json=payload)
+            response = self.notifier._post_json(payload)
             if response.status_code == 204:
                 logger.info("Startup message sent to Discord")
             else:
@@ -286,8 +243,7 @@ All strategy monitors are now running and will send alerts when trading setups a
         logger.info("Starting Strategy Monitor...")
         
         # Schedule all monitors
-        for monitor in self.monitors:
-            self._schedule_monitor(monitor)
+        self._schedule_monitors()
         
         # Send startup message
         self.send_startup_message()
@@ -303,6 +259,8 @@ All strategy monitors are now running and will send alerts when trading setups a
             logger.info("Strategy Monitor stopped by user")
         except Exception as e:
             logger.error(f"Unexpected error in strategy monitor: {e}")
+        finally:
+            self.executor.shutdown(wait=True)
 
 def main():
     """Main entry point"""
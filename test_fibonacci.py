@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Fibonacci level, trading level and chart tests over the user-reported setups
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from _fixtures import FIB_RATIOS, buffered_stdout, fib_prices, find_swings, get_detector, make_ohlcv
+
+# (swing_high, swing_low, current_price, setup_type) from user-reported alerts
+FIB_CASES = [
+    (3.76, 3.54, 3.61, "LONG"),
+    (115720.00, 112650.00, 114043.11, "SHORT"),
+    (16.80, 16.44, 16.60, "LONG"),
+    (3736.73, 3483.50, 3585.89, "SHORT"),
+    (115096.73, 112650.00, 113752.01, "SHORT"),
+]
+
+def trend_for(setup_type):
+    """SHORT setups retrace up after a down move, LONG setups retrace down after an up move"""
+    return "DOWNTREND" if setup_type == "SHORT" else "UPTREND"
+
+def expected_levels(cases):
+    """Reference prices for all cases in one broadcast: retracement back from the end of the move, 0%/100% at its start/end"""
+    hi = np.array([case[0] for case in cases])[:, None]
+    lo = np.array([case[1] for case in cases])[:, None]
+    short = np.array([case[3] == "SHORT" for case in cases])[:, None]
+    span = hi - lo
+    levels = np.where(short, lo + FIB_RATIOS * span, hi - FIB_RATIOS * span)
+    levels[:, [0]] = np.where(short, hi, lo)
+    levels[:, [-1]] = np.where(short, lo, hi)
+    return levels
+
+# Reference level arrays (rows of one (cases, ratios) matrix), built once for every case
+EXPECTED = dict(zip(((hi, lo, setup) for hi, lo, _, setup in FIB_CASES), expected_levels(FIB_CASES)))
+
+@pytest.mark.parametrize("hi,lo,cur,setup", FIB_CASES)
+def test_fibonacci_levels(hi, lo, cur, setup):
+    """Every level, including the 0.618 entry and the swing anchors, matches the retracement direction"""
+    prices = get_detector().calculate_fibonacci_level_array(hi, lo, trend_for(setup))
+    np.testing.assert_allclose(prices, EXPECTED[(hi, lo, setup)], rtol=0, atol=1e-6)
+
+def test_batch_levels():
+    """Batch calculation over all cases matches the per-pair levels row for row"""
+    detector = get_detector()
+    batch = detector.calculate_fibonacci_levels_batch(
+        [case[0] for case in FIB_CASES], [case[1] for case in FIB_CASES], [case[3] == "SHORT" for case in FIB_CASES]
+    )
+    for row, (hi, lo, _, setup) in zip(batch, FIB_CASES):
+        np.testing.assert_array_equal(row, detector.calculate_fibonacci_level_array(hi, lo, trend_for(setup)))
+
+def test_user_reported_levels():
+    """Levels match, to the cent, the table from the user's 16.80 / 16.44 LONG alert"""
+    user = np.array([16.44, 16.72, 16.66, 16.62, 16.58, 16.52, 16.80])
+    prices = get_detector().calculate_fibonacci_level_array(16.80, 16.44, "UPTREND")
+    assert np.allclose(prices, user, rtol=0, atol=0.01)
+
+@pytest.mark.parametrize("hi,lo,cur,setup", FIB_CASES)
+def test_trading_levels(hi, lo, cur, setup):
+    """Stop loss sits beyond 78.6% and take profits step back toward the move's origin"""
+    detector = get_detector()
+    fib_levels = detector.calculate_fibonacci_levels(hi, lo, trend_for(setup))
+    levels = detector.calculate_trading_levels(fib_levels, cur, setup)
+
+    assert levels['setup_type'] == setup
+    assert levels['entry'] == round(cur, 4)
+    ladder = [levels['sl'], levels['tp1'], levels['tp2'], levels['tp3']]
+    if setup == "LONG":
+        assert ladder == sorted(ladder)
+    else:
+        assert ladder == sorted(ladder, reverse=True)
+
+@pytest.mark.parametrize("hi,lo,cur,setup", FIB_CASES)
+def test_618_retracement_check(hi, lo, cur, setup):
+    """Price on the 61.8% level is accepted, 1% away from it is not"""
+    detector = get_detector()
+    fib_levels = detector.calculate_fibonacci_levels(hi, lo, trend_for(setup))
+    level = fib_levels[0.618]
+    assert detector.check_618_retracement(level, fib_levels)
+    assert not detector.check_618_retracement(level * 1.01, fib_levels)
+    assert not detector.check_618_retracement(level * 0.99, fib_levels)
+
+def test_chart_generation():
+    """Chart generation runs end to end on a synthetic downtrend"""
+    detector = get_detector()
+    df = make_ohlcv(n=100, seed=42)
+    swing_high_idx, swing_low_idx, swing_high_price, swing_low_price, trend = find_swings(df)
+    current_price = df['close'].iat[-1]
+
+    fib_levels = detector.calculate_fibonacci_levels(swing_high_price, swing_low_price, trend + "TREND")
+    prices = fib_prices(fib_levels)
+    assert np.all((prices >= swing_low_price) & (prices <= swing_high_price))
+    np.testing.assert_allclose(prices, expected_levels([(swing_high_price, swing_low_price, current_price,
+                                                         "SHORT" if trend == "DOWN" else "LONG")])[0])
+
+    chart_filename = detector.generate_chart(
+        df, swing_high_idx, swing_low_idx, fib_levels, current_price, "BTCUSDT", "15m", trend
+    )
+    assert chart_filename is not None
+    if os.path.exists(chart_filename):
+        os.remove(chart_filename)
+
+if __name__ == "__main__":
+    with buffered_stdout():
+        for case in FIB_CASES:
+            test_fibonacci_levels(*case)
+            test_trading_levels(*case)
+            test_618_retracement_check(*case)
+        test_batch_levels()
+        test_user_reported_levels()
+        test_chart_generation()
+        print("✅ All Fibonacci tests passed")
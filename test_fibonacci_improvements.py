@@ -6,25 +6,17 @@ This script tests the corrected Fibonacci calculations, proper swing detection,
 and enhanced chart generation with annotations.
 """
 
-import sys
-import os
-sys.path.append('fibonacci_monitors')
-
-from fibonacci_detector import FibonacciDetector
+from _fixtures import binance_ohlcv, binance_swings, buffered_stdout, get_detector, run_concurrently
 from config import *
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
 def test_fibonacci_calculations():
     """Test the corrected Fibonacci calculations"""
     print("\n" + "=" * 60)
     print("Testing Improved Fibonacci Calculations")
     print("=" * 60)
     
-    detector = FibonacciDetector()
+    detector = get_detector()
     
     # Test case 1: Uptrend (swing low to swing high)
     print("\n📈 Test Case 1: UPTREND")
@@ -32,11 +24,11 @@ def test_fibonacci_calculations():
     swing_low = 100.0
     swing_high = 120.0
     
-    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low)
+    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low, "UPTREND")
     
     print("✅ Fibonacci levels for UPTREND:")
-    for level, price in fib_levels.items():
-        print(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}")
+    print("\n".join(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}" for level, price in fib_levels.items()))
+    assert (fib_levels[0.0], fib_levels[1.0]) == (swing_low, swing_high)
     
     # Test case 2: Downtrend (swing high to swing low)
     print("\n📉 Test Case 2: DOWNTREND")
@@ -44,13 +36,11 @@ def test_fibonacci_calculations():
     swing_high = 120.0
     swing_low = 100.0
     
-    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low)
+    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low, "DOWNTREND")
     
     print("✅ Fibonacci levels for DOWNTREND:")
-    for level, price in fib_levels.items():
-        print(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}")
-    
-    return True
+    print("\n".join(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}" for level, price in fib_levels.items()))
+    assert (fib_levels[0.0], fib_levels[1.0]) == (swing_high, swing_low)
 
 def test_data_fetching():
     """Test data fetching with fallback"""
@@ -58,20 +48,14 @@ def test_data_fetching():
     print("Testing Data Fetching with Fallback")
     print("=" * 60)
     
-    detector = FibonacciDetector()
-    
     # Test with BTCUSDT
     print("\n🔄 Testing BTCUSDT 4h data...")
-    df = detector.get_binance_data("BTCUSDT", "4h", 100)
+    df = binance_ohlcv("BTCUSDT", "4h", 100)
+    assert not df.empty, "Failed to fetch data"
     
-    if not df.empty:
-        print(f"✅ Successfully fetched {len(df)} candles")
-        print(f"   Latest price: ${df['close'].iloc[-1]:.2f}")
-        print(f"   Date range: {df.index[0]} to {df.index[-1]}")
-        return True
-    else:
-        print("❌ Failed to fetch data")
-        return False
+    print(f"✅ Successfully fetched {len(df)} candles")
+    print(f"   Latest price: ${df['close'].iat[-1]:.2f}")
+    print(f"   Date range: {df.index[0]} to {df.index[-1]}")
 
 def test_swing_detection():
     """Test improved swing detection"""
@@ -79,45 +63,37 @@ def test_swing_detection():
     print("Testing Improved Swing Detection")
     print("=" * 60)
     
-    detector = FibonacciDetector()
-    
-    # Fetch real data
-    df = detector.get_binance_data("BTCUSDT", "4h", 100)
-    if df.empty:
-        print("❌ No data available for swing detection test")
-        return False
-    
-    # Test swing detection
-    swing_high_idx, swing_low_idx = detector.detect_swing_points(df, 50)
-    
-    if swing_high_idx is not None and swing_low_idx is not None:
-        swing_high_price = df.loc[swing_high_idx, 'high']
-        swing_low_price = df.loc[swing_low_idx, 'low']
-        move_percent = abs(swing_high_price - swing_low_price) / swing_low_price * 100
-        
-        print("✅ Swing points detected:")
-        print(f"   Swing High: ${swing_high_price:.2f} at {swing_high_idx}")
-        print(f"   Swing Low: ${swing_low_price:.2f} at {swing_low_idx}")
-        print(f"   Move: {move_percent:.2f}%")
-        
-        # Test Fibonacci calculation with detected swings
-        fib_levels = detector.calculate_fibonacci_levels(swing_high_price, swing_low_price)
-        current_price = df['close'].iloc[-1]
-        
-        print(f"\n📊 Current Price: ${current_price:.2f}")
-        print("Fibonacci Levels:")
-        for level, price in fib_levels.items():
-            marker = " ⭐" if level == 0.618 else ""
-            print(f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}{marker}")
-        
-        # Test 61.8% retracement detection
-        is_at_level = detector.check_618_retracement(current_price, fib_levels)
-        print(f"\n🎯 61.8% Retracement Detected: {'✅ YES' if is_at_level else '❌ NO'}")
-        
-        return True
-    else:
-        print("❌ No valid swing points detected")
-        return False
+    detector = get_detector()
+    
+    # Fetch real data and detect swings (shared with the chart test)
+    df, swing_high_idx, swing_low_idx = binance_swings("BTCUSDT", "4h", 100, 50)
+    assert not df.empty, "No data available for swing detection test"
+    assert swing_high_idx is not None and swing_low_idx is not None, "No valid swing points detected"
+    
+    swing_high_price = df.at[swing_high_idx, 'high']
+    swing_low_price = df.at[swing_low_idx, 'low']
+    move_percent = abs(swing_high_price - swing_low_price) / swing_low_price * 100
+    
+    print("✅ Swing points detected:")
+    print(f"   Swing High: ${swing_high_price:.2f} at {swing_high_idx}")
+    print(f"   Swing Low: ${swing_low_price:.2f} at {swing_low_idx}")
+    print(f"   Move: {move_percent:.2f}%")
+    
+    # Test Fibonacci calculation with detected swings
+    trend = "DOWNTREND" if swing_high_idx < swing_low_idx else "UPTREND"
+    fib_levels = detector.calculate_fibonacci_levels(swing_high_price, swing_low_price, trend)
+    current_price = df['close'].iat[-1]
+    
+    print(f"\n📊 Current Price: ${current_price:.2f}")
+    print("Fibonacci Levels:")
+    print("\n".join(
+        f"   {FIBONACCI_LEVELS[level]}: ${price:.2f}{' ⭐' if level == 0.618 else ''}"
+        for level, price in fib_levels.items()
+    ))
+    
+    # Test 61.8% retracement detection (live price, so either answer is valid)
+    is_at_level = detector.check_618_retracement(current_price, fib_levels)
+    print(f"\n🎯 61.8% Retracement Detected: {'✅ YES' if is_at_level else '❌ NO'}")
 
 def test_chart_generation():
     """Test enhanced chart generation"""
@@ -125,48 +101,38 @@ def test_chart_generation():
     print("Testing Enhanced Chart Generation")
     print("=" * 60)
     
-    detector = FibonacciDetector()
-    
-    # Fetch data
-    df = detector.get_binance_data("BTCUSDT", "4h", 100)
-    if df.empty:
-        print("❌ No data available for chart generation test")
-        return False
+    detector = get_detector()
     
-    # Detect swings
-    swing_high_idx, swing_low_idx = detector.detect_swing_points(df, 50)
-    if swing_high_idx is None or swing_low_idx is None:
-        print("❌ No swing points for chart generation")
-        return False
+    # Fetch data and detect swings (shared with the swing detection test)
+    df, swing_high_idx, swing_low_idx = binance_swings("BTCUSDT", "4h", 100, 50)
+    assert not df.empty, "No data available for chart generation test"
+    assert swing_high_idx is not None and swing_low_idx is not None, "No swing points for chart generation"
     
     # Calculate Fibonacci levels
-    swing_high_price = df.loc[swing_high_idx, 'high']
-    swing_low_price = df.loc[swing_low_idx, 'low']
-    current_price = df['close'].iloc[-1]
-    fib_levels = detector.calculate_fibonacci_levels(swing_high_price, swing_low_price)
-    
-    # Generate chart
-    print("🎨 Generating enhanced chart...")
-    # Determine trend for chart generation
+    swing_high_price = df.at[swing_high_idx, 'high']
+    swing_low_price = df.at[swing_low_idx, 'low']
+    current_price = df['close'].iat[-1]
+    # Determine trend for levels and chart generation
     swing_high_pos = df.index.get_loc(swing_high_idx)
     swing_low_pos = df.index.get_loc(swing_low_idx)
     trend = "DOWN" if swing_high_pos < swing_low_pos else "UP"
+    fib_levels = detector.calculate_fibonacci_levels(swing_high_price, swing_low_price, trend + "TREND")
+    
+    # Generate chart
+    print("🎨 Generating enhanced chart...")
     
     chart_filename = detector.generate_chart(df, swing_high_idx, swing_low_idx, fib_levels, current_price, "BTCUSDT", "4h", trend)
     
-    if chart_filename and os.path.exists(chart_filename):
-        print(f"✅ Chart generated successfully: {chart_filename}")
-        print("   Chart includes:")
-        print("   • Candlestick data")
-        print("   • Fibonacci trend line")
-        print("   • All Fibonacci levels with annotations")
-        print("   • Current price marker")
-        print("   • Swing point markers")
-        print("   • 61.8% level highlight")
-        return True
-    else:
-        print("❌ Failed to generate chart")
-        return False
+    # Under pytest savefig is stubbed out, so only the returned filename is checked
+    assert chart_filename is not None, "Failed to generate chart"
+    print(f"✅ Chart generated successfully: {chart_filename}")
+    print("   Chart includes:")
+    print("   • Candlestick data")
+    print("   • Fibonacci trend line")
+    print("   • All Fibonacci levels with annotations")
+    print("   • Current price marker")
+    print("   • Swing point markers")
+    print("   • 61.8% level highlight")
 
 def test_trading_levels():
     """Test trading level calculations"""
@@ -174,15 +140,15 @@ def test_trading_levels():
     print("Testing Trading Level Calculations")
     print("=" * 60)
     
-    detector = FibonacciDetector()
+    detector = get_detector()
     
     # Test with sample data
     swing_high = 120.0
     swing_low = 100.0
     current_price = 108.0  # Near 61.8% level
     
-    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low)
-    trading_levels = detector.calculate_trading_levels(fib_levels, current_price, "BTCUSDT")
+    fib_levels = detector.calculate_fibonacci_levels(swing_high, swing_low, "UPTREND")
+    trading_levels = detector.calculate_trading_levels(fib_levels, current_price, "LONG")
     
     print("✅ Trading levels calculated:")
     print(f"   Setup Type: {trading_levels['setup_type']}")
@@ -192,7 +158,8 @@ def test_trading_levels():
     print(f"   Take Profit 3: ${trading_levels['tp3']:.2f}")
     print(f"   Stop Loss: ${trading_levels['sl']:.2f}")
     
-    return True
+    ladder = [trading_levels['sl'], trading_levels['tp1'], trading_levels['tp2'], trading_levels['tp3']]
+    assert ladder == sorted(ladder), f"LONG levels out of order: {ladder}"
 
 def main():
     """Run all tests"""
@@ -210,15 +177,16 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-                print(f"✅ {test_name}: PASSED")
-            else:
-                print(f"❌ {test_name}: FAILED")
-        except Exception as e:
-            print(f"❌ {test_name}: ERROR - {e}")
+    # The live-data tests wait on Binance, so all tests run at once; output is printed in test order
+    for test_name, result, output in run_concurrently(tests):
+        print(output, end="")
+        if isinstance(result, AssertionError):
+            print(f"❌ {test_name}: FAILED - {result}")
+        elif isinstance(result, Exception):
+            print(f"❌ {test_name}: ERROR - {result}")
+        else:
+            passed += 1
+            print(f"✅ {test_name}: PASSED")
     
     print("\n" + "=" * 60)
     print(f"📊 TEST RESULTS: {passed}/{total} tests passed")
@@ -231,4 +199,7 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Set up logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    with buffered_stdout():
+        main() 
@@ -3,15 +3,23 @@
 Test script to verify Fibonacci labels are correctly displayed
 """
 
-import sys
-import os
-sys.path.append('fibonacci_monitors')
+from _fixtures import buffered_stdout, get_detector
+from config import FIBONACCI_LEVELS
 
-from fibonacci_detector import FibonacciDetector
+def print_labelled_levels(fib_levels, setup_type):
+    """Print the level table with the swing anchor labels used in Discord alerts, in one write"""
+    anchors = {
+        0.0: 'Swing High' if setup_type == 'SHORT' else 'Swing Low',
+        1.0: 'Swing Low' if setup_type == 'SHORT' else 'Swing High',
+    }
+    print("\n".join(
+        f"{FIBONACCI_LEVELS[level]}{f' ({anchors[level]})' if level in anchors else ''}: ${price:.2f}"
+        for level, price in fib_levels.items()
+    ))
 
 def test_fibonacci_labels():
     """Test that Fibonacci labels are correctly displayed"""
-    detector = FibonacciDetector()
+    detector = get_detector()
     
     # Test case from user's examples
     swing_high = 3736.73
@@ -26,30 +34,18 @@ def test_fibonacci_labels():
     
     # Test SHORT setup (DOWN trend)
     print("SHORT Setup (DOWN trend):")
-    fib_levels_short = detector.calculate_fibonacci_levels(swing_high, swing_low, "DOWN")
+    fib_levels_short = detector.calculate_fibonacci_levels(swing_high, swing_low, "DOWNTREND")
     setup_type = "SHORT"
     
-    print(f"0% (Swing High): ${fib_levels_short[0.0]:.2f}")
-    print(f"23.6%: ${fib_levels_short[0.236]:.2f}")
-    print(f"38.2%: ${fib_levels_short[0.382]:.2f}")
-    print(f"50%: ${fib_levels_short[0.5]:.2f}")
-    print(f"61.8%: ${fib_levels_short[0.618]:.2f}")
-    print(f"78.6%: ${fib_levels_short[0.786]:.2f}")
-    print(f"100% (Swing Low): ${fib_levels_short[1.0]:.2f}")
+    print_labelled_levels(fib_levels_short, setup_type)
     print()
     
     # Test LONG setup (UP trend)
     print("LONG Setup (UP trend):")
-    fib_levels_long = detector.calculate_fibonacci_levels(swing_high, swing_low, "UP")
+    fib_levels_long = detector.calculate_fibonacci_levels(swing_high, swing_low, "UPTREND")
     setup_type = "LONG"
     
-    print(f"0% (Swing Low): ${fib_levels_long[0.0]:.2f}")
-    print(f"23.6%: ${fib_levels_long[0.236]:.2f}")
-    print(f"38.2%: ${fib_levels_long[0.382]:.2f}")
-    print(f"50%: ${fib_levels_long[0.5]:.2f}")
-    print(f"61.8%: ${fib_levels_long[0.618]:.2f}")
-    print(f"78.6%: ${fib_levels_long[0.786]:.2f}")
-    print(f"100% (Swing High): ${fib_levels_long[1.0]:.2f}")
+    print_labelled_levels(fib_levels_long, setup_type)
     print()
     
     # Test the label logic
@@ -72,4 +68,5 @@ def test_fibonacci_labels():
     print("✅ Labels should now be correct in Discord notifications")
 
 if __name__ == "__main__":
-    test_fibonacci_labels() 
\ No newline at end of file
+    with buffered_stdout():
+        test_fibonacci_labels() 
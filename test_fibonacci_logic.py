@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
 
+import numpy as np
+
+from _fixtures import FIB_RATIOS, FIB_618, print_fib_levels, buffered_stdout, get_detector
+
 def test_fibonacci_logic():
     """Test different Fibonacci calculation approaches for SHORT setup"""
     
@@ -14,44 +18,27 @@ def test_fibonacci_logic():
     print(f"Current Price: ${current_price:.2f}")
     print()
     
-    # Current approach (what we're doing now)
-    print("Current Approach (0% = Swing High, 100% = Swing Low):")
+    # Both approaches in one broadcast: row 0 counts down from the swing high, row 1 up from the swing low
     price_range = swing_high - swing_low
-    fib_levels_current = {
-        0.0: swing_high,
-        0.236: swing_high - (0.236 * price_range),
-        0.382: swing_high - (0.382 * price_range),
-        0.5: swing_high - (0.5 * price_range),
-        0.618: swing_high - (0.618 * price_range),
-        0.786: swing_high - (0.786 * price_range),
-        1.0: swing_low
-    }
+    fib_levels_current, fib_levels_alt = (
+        np.array([[swing_high], [swing_low]]) + np.array([[-price_range], [price_range]]) * FIB_RATIOS
+    )
     
-    for level, price in sorted(fib_levels_current.items()):
-        print(f"  {level*100:.0f}%: ${price:.2f}")
+    # Current approach (what we're doing now)
+    print("Current Approach (0% = Swing High, 100% = Swing Low):")
+    print_fib_levels(fib_levels_current)
     
     print()
     
     # Alternative approach (0% = Swing Low, 100% = Swing High)
     print("Alternative Approach (0% = Swing Low, 100% = Swing High):")
-    fib_levels_alt = {
-        0.0: swing_low,
-        0.236: swing_low + (0.236 * price_range),
-        0.382: swing_low + (0.382 * price_range),
-        0.5: swing_low + (0.5 * price_range),
-        0.618: swing_low + (0.618 * price_range),
-        0.786: swing_low + (0.786 * price_range),
-        1.0: swing_high
-    }
-    
-    for level, price in sorted(fib_levels_alt.items()):
-        print(f"  {level*100:.0f}%: ${price:.2f}")
+    print_fib_levels(fib_levels_alt)
     
     print()
     
     # Check which 61.8% level is closer to current price
-    current_618 = fib_levels_current[0.618]
-    alt_618 = fib_levels_alt[0.618]
+    current_618 = fib_levels_current[FIB_618]
+    alt_618 = fib_levels_alt[FIB_618]
     
     print(f"Current Price: ${current_price:.2f}")
     print(f"Current 61.8%: ${current_618:.2f} (diff: {abs(current_price - current_618):.2f})")
@@ -61,6 +48,13 @@ def test_fibonacci_logic():
         print("Current approach is closer!")
     else:
         print("Alternative approach is closer!")
+    
+    # A SHORT setup retraces up from the swing low, so the detector's DOWNTREND levels are the alternative approach
+    detector_levels = get_detector().calculate_fibonacci_level_array(swing_high, swing_low, "DOWNTREND")
+    np.testing.assert_allclose(detector_levels[1:-1], fib_levels_alt[1:-1])
+    assert abs(current_price - alt_618) <= abs(current_price - current_618) + 1e-6, \
+        "Alternative 61.8% level should be at least as close to the retraced price"
 
 if __name__ == "__main__":
-    test_fibonacci_logic() 
\ No newline at end of file
+    with buffered_stdout():
+        test_fibonacci_logic() 